@@ -1,26 +1,24 @@
 # -*- coding:utf-8 -*-
-from .logger import log_debug, log_info, log_warning, log_error, log_critical
+import math
+import operator
+import random
+import re
+import threading
+from collections import namedtuple, OrderedDict
+from functools import lru_cache, partial
+
+from .logger import log_debug, log_info, log_warning, log_error, log_critical, is_enabled_for, silent
 
 
 """
 通用工具函数
 """
 def get_nested_value(obj, path):
-    """根据点分隔的路径获取嵌套值"""
-    if not path:
-        return obj
-
-    parts = path.split('.')
-    current = obj
-
-    for part in parts:
-        if not isinstance(current, dict):
-            raise TypeError(f"路径 '{path}' 中的 '{part}' 需要字典类型，当前类型: {type(current)}")
-        if part not in current:
-            raise KeyError(f"路径 '{path}' 中的字段 '{part}' 不存在")
-        current = current[part]
-
-    return current
+    """根据点分隔的路径获取嵌套值（支持列表索引，如 data.items.0.id）"""
+    compiled = _compile_path(path)
+    if compiled.has_wildcard:
+        raise ValueError(f"路径 '{path}' 包含通配符'*'或切片，无法获取单个值")
+    return compiled.resolve(obj)[0]
 
 def is_empty_value(value):
     """判断值是否为空"""
@@ -40,12 +38,13 @@ def is_empty_value(value):
 极简通用数据校验 - 默认非空校验，调用简洁
 """
 
-def check(data, *validations):
+def check(data, *validations, quiet=False):
     """
     极简数据校验函数 - 默认非空校验
     
     :param data: 要校验的数据
     :param validations: 校验规则，支持多种简洁格式
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志，也不构建日志消息
     :return: True表示所有校验通过，False表示存在校验失败
     :raises: Exception: 当参数错误或数据结构异常时抛出异常
     
@@ -68,90 +67,435 @@ def check(data, *validations):
     # 嵌套列表校验
     check(response, "data.productList.*.purchasePlan.*.id > 0")
     
-    注意：日志输出级别可通过项目的 --log-level 参数控制
+    # 预编译规则 - 一次解析，多次校验
+    plan = compile_rules("data.product.id > 0", "data.product.name")
+    check(response, plan)
+    
+    # 静默校验 - 压测等高频调用场景
+    check(response, plan, quiet=True)
+    
+    注意：日志输出级别可通过项目的 --log-level 参数控制，set_silent() 可全局关闭日志
     """
+    if quiet:
+        with silent():
+            return check(data, *validations)
+    
+    # 预编译校验规则（已预编译的规则集合直接展开，不再重复解析）
+    rules = _compile_validations(validations)
+    
+    # 打印任务信息和数据概览（调试信息仅在开启调试日志时构建）
+    debug = is_enabled_for("debug")
+    log_info("开始执行数据校验 - 共%d个校验规则", len(rules))
+    if debug:
+        log_debug(f"待校验数据类型: {type(data).__name__}")
+        log_debug(f"校验规则列表: {list(validations)}")
+    
+    # 共享路径前缀的规则在一次遍历中校验（单个规则集合复用其预构建的前缀树）
+    if len(validations) == 1 and isinstance(validations[0], RulePlan):
+        plan = validations[0]
+    else:
+        plan = RulePlan(rules)
     
-    # 打印任务信息和数据概览
-    log_info(f"开始执行数据校验 - 共{len(validations)}个校验规则")
-    log_debug(f"待校验数据类型: {type(data).__name__}")
-    log_debug(f"校验规则列表: {list(validations)}")
+    try:
+        results = plan.trie.run(data)
+    except _RuleError as e:
+        # 数据结构异常，抛出异常
+        i = e.index
+        error_msg = f"数据结构异常: {rules[i]} - {str(e.error)}"
+        log_error(f"[{i+1}/{len(rules)}] ❌ {error_msg}")
+        raise Exception(error_msg)
     
     passed_count = 0
     failed_count = 0
     
-    for i, validation in enumerate(validations):
-        try:
-            log_debug(f"[{i+1}/{len(validations)}] 开始校验: {validation}")
-            
-            result = _parse_and_validate(data, validation)
-            if result:
-                passed_count += 1
-                log_debug(f"[{i+1}/{len(validations)}] 校验通过: {validation} ✓")
-            else:
-                failed_count += 1
-                log_warning(f"[{i+1}/{len(validations)}] 校验失败: {validation} ✗")
-                
-        except (KeyError, IndexError, TypeError, ValueError) as e:
-            # 数据结构异常，抛出异常
-            error_msg = f"数据结构异常: {validation} - {str(e)}"
-            log_error(f"[{i+1}/{len(validations)}] ❌ {error_msg}")
-            raise Exception(error_msg)
-        except Exception as e:
-            # 校验逻辑失败，记录为失败
+    for i, (rule, result) in enumerate(zip(rules, results)):
+        if result:
+            passed_count += 1
+            if debug:
+                log_debug(f"[{i+1}/{len(rules)}] 校验通过: {rule} ✓")
+        else:
             failed_count += 1
-            log_warning(f"[{i+1}/{len(validations)}] 校验异常: {validation} - {str(e)} ✗")
+            log_warning("[%d/%d] 校验失败: %s ✗", i + 1, len(rules), rule)
     
     # 打印最终结果
-    success_rate = f"{passed_count}/{len(validations)}"
-    log_info(f"数据校验完成: {success_rate} 通过 (成功率: {passed_count/len(validations)*100:.1f}%)")
+    # 空规则集合（如 compile_rules() 无参数）视为全部通过
+    success_rate = passed_count / len(rules) * 100 if rules else 100.0
+    log_info("数据校验完成: %d/%d 通过 (成功率: %.1f%%)", passed_count, len(rules), success_rate)
     
     if failed_count > 0:
-        log_debug(f"失败统计: 共{failed_count}个校验失败")
+        log_debug("失败统计: 共%d个校验失败", failed_count)
     
     # 返回校验结果
     return failed_count == 0
 
 
-def _parse_and_validate(data, rule):
-    """解析校验规则并执行校验"""
+"""
+规则预编译 - 一次解析，多次校验
+"""
+
+class _Rule:
+    """预编译后的单条校验规则（不可变）
+    
+    持有预先切分好的字段路径、绑定的校验器函数以及已解析的期望值，
+    校验时直接使用，不再重复解析规则字符串。
+    source 为 None 时（如链式调用直接构建的规则），仅在首次输出时生成规则描述。
+    字段路径含量词通配符（如 payments.*any.is_default）时，path 为量词之前的集合路径，
+    func 在集合上按量词统计满足剩余路径规则的元素个数，quantifier 为 (下限, 上限)。
+    path_func 为 True 时 func 还需要值的路径（条件校验的 then 规则据此输出完整路径）。
+    """
+    __slots__ = ('_source', 'field_path', 'path', 'validator', 'expect', 'func', 'quantifier', 'path_func')
+
+    def __init__(self, source, field_path, validator, expect, func=None):
+        path = _compile_path(field_path)
+        func = func or _resolve_validator(validator, expect)
+        quantifier = None
+        if path.quantified >= 0:
+            # 量词之后的路径作为元素规则（可再含量词），量词之前的路径定位集合
+            names = [segment[0] for segment in path.segments]
+            index = path.quantified
+            element_rule = _Rule(None, ".".join(names[index + 1:]), validator, expect, func)
+            quantifier = _parse_quantifier(names[index])
+            path = _compile_path(".".join(names[:index]))
+            func = _quantified(element_rule, *quantifier)
+        _set = object.__setattr__
+        _set(self, '_source', source)
+        _set(self, 'field_path', field_path)
+        _set(self, 'path', path)
+        _set(self, 'validator', validator)
+        _set(self, 'expect', expect)
+        _set(self, 'func', func)
+        _set(self, 'quantifier', quantifier)
+        _set(self, 'path_func', validator == "conditional_check" and quantifier is None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"预编译规则不可修改: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"预编译规则不可修改: {name}")
+
+    @property
+    def source(self):
+        source = self._source
+        if source is None:
+            source = _describe_rule(self.field_path, self.validator, self.expect)
+            object.__setattr__(self, '_source', source)
+        return source
+
+    def __str__(self):
+        return self.source
+
+    def __repr__(self):
+        return f"<Rule {self.source!r}>"
+
+
+class RulePlan:
+    """预编译的校验规则集合（不可变）
+    
+    由 compile_rules() 或 DataChecker.freeze() 创建，可直接传给 check()、check_list()、check_when()
+    以及 DataChecker.validate()，在多份数据上重复使用而无需再次解析规则。
+    规则集合创建后不再修改，可在多个线程间共享。
+    """
+    __slots__ = ('rules', '_trie')
+
+    def __init__(self, rules):
+        object.__setattr__(self, 'rules', tuple(rules))
+        object.__setattr__(self, '_trie', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"预编译规则集合不可修改: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"预编译规则集合不可修改: {name}")
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __repr__(self):
+        return f"RulePlan({[rule.source for rule in self.rules]})"
+
+    @property
+    def trie(self):
+        """规则路径前缀树，首次使用时构建"""
+        trie = self._trie
+        if trie is None:
+            trie = _PrefixTrie(self.rules)
+            object.__setattr__(self, '_trie', trie)
+        return trie
+
+    def validate(self, data, quiet=False):
+        """使用本规则集合校验数据，等同于 check(data, plan, quiet=quiet)"""
+        return check(data, self, quiet=quiet)
+
+
+def _describe_rule(field_path, validator, expect):
+    """生成规则描述：有对应操作符时使用字符串语法，否则使用字典格式"""
+    if validator == "not_empty":
+        return field_path
+    symbol = _OPERATOR_SYMBOLS.get(validator)
+    if symbol is not None:
+        return f"{field_path} {symbol} {expect!r}"
+    return str({'field': field_path, 'validator': validator, 'expect': expect})
+
+
+def compile_rules(*validations):
+    """
+    预编译校验规则 - 解析一次，多次校验
+    
+    :param validations: 校验规则，支持字符串、字典格式以及已预编译的规则集合
+    :return: RulePlan 不可变的预编译规则集合
+    :raises: ValueError: 当规则格式错误时抛出异常
+    
+    示例：
+    plan = compile_rules("data.product.id > 0", "data.product.name")
+    for response in responses:
+        check(response, plan)
+    """
+    rules = []
+    for validation in validations:
+        rules.extend(_compile_validation(validation))
+    return RulePlan(rules)
+
+
+def _compile_validations(validations):
+    """编译一组校验参数，规则格式错误时记录日志并抛出异常"""
+    rules = []
+    for i, validation in enumerate(validations):
+        try:
+            rules.extend(_compile_validation(validation))
+        except ValueError as e:
+            error_msg = f"数据结构异常: {validation} - {str(e)}"
+            log_error(f"[{i+1}/{len(validations)}] ❌ {error_msg}")
+            raise Exception(error_msg)
+    return rules
+
+
+def _compile_validation(validation):
+    """将单个校验参数编译为规则元组（预编译规则集合直接展开）"""
+    if isinstance(validation, RulePlan):
+        return validation.rules
+    if isinstance(validation, _Rule):
+        return (validation,)
+    return (_parse_cached(validation),)
+
+
+"""
+规则解析缓存 - 进程级 LRU 缓存，相同规则无需重复解析
+"""
+
+RuleCacheInfo = namedtuple('RuleCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _RuleCache:
+    """线程安全的有界 LRU 缓存，记录命中/未命中次数"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            rule = self.entries.get(key)
+            if rule is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return rule
+
+    def put(self, key, rule):
+        if self.maxsize == 0:
+            return
+        with self.lock:
+            self.entries[key] = rule
+            self.entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+
+    def resize(self, maxsize):
+        with self.lock:
+            self.maxsize = maxsize
+            if maxsize is not None:
+                while len(self.entries) > maxsize:
+                    self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self.lock:
+            return RuleCacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+
+_rule_cache = _RuleCache(maxsize=1024)
+
+
+def set_rule_cache_size(maxsize):
+    """
+    设置规则解析缓存的最大条目数，超出时淘汰最久未使用的规则
+    
+    :param maxsize: 最大条目数，0 表示关闭缓存，None 表示不限制
+    """
+    if maxsize is not None and (not isinstance(maxsize, int) or maxsize < 0):
+        raise ValueError(f"缓存大小必须是非负整数或None，当前值: {maxsize!r}")
+    _rule_cache.resize(maxsize)
+
+
+def rule_cache_info():
+    """
+    获取规则解析缓存统计信息
+    
+    :return: RuleCacheInfo(hits, misses, maxsize, currsize)
+    
+    示例：
+    info = rule_cache_info()
+    hit_rate = info.hits / max(info.hits + info.misses, 1)
+    """
+    return _rule_cache.info()
+
+
+def clear_rule_cache():
+    """清空规则解析缓存并重置统计信息"""
+    _rule_cache.clear()
+
+
+def _freeze(value):
+    """将规则转换为可哈希的缓存键（附带类型，避免 1、1.0、True 等相等值互相命中）"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _parse_cached(rule):
+    """解析校验规则，优先从缓存中获取"""
+    try:
+        key = _freeze(rule)
+    except TypeError:
+        # 包含不可哈希的值，不缓存
+        return _parse_and_validate(rule)
+    
+    compiled = _rule_cache.get(key)
+    if compiled is None:
+        compiled = _parse_and_validate(rule)
+        _rule_cache.put(key, compiled)
+    return compiled
+
+
+def _parse_and_validate(rule):
+    """解析校验规则为预编译规则"""
     if isinstance(rule, str):
-        return _parse_string_rule(data, rule)
+        return _parse_string_rule(rule)
     elif isinstance(rule, dict):
-        return _parse_dict_rule(data, rule)
+        return _parse_dict_rule(rule)
     else:
         raise ValueError(f"不支持的校验规则格式: {type(rule)}")
 
 
-def _parse_string_rule(data, rule):
+_PATTERN_TYPE = type(re.compile(''))
+
+# 支持的操作符映射
+_OPERATORS = {
+    "#<=": "length_le", "#>=": "length_ge", "#!=": "length_ne", "#=": "length_eq", "#<": "length_lt", "#>": "length_gt", "!=": "ne",
+    "==": "eq", "<=": "le", ">=": "ge", "<": "lt", ">": "gt",
+    "~=": "regex", "^=": "startswith", "$=": "endswith", "*=": "contains", "=*": "contained_by",
+    "@=": "type_match"
+}
+# 校验器 -> 操作符，用于生成规则描述
+_OPERATOR_SYMBOLS = {validator: op for op, validator in _OPERATORS.items()}
+# 所有操作符合并为一个正则（按长度降序，同一位置最长匹配优先），一次扫描即可定位第一个操作符
+_OPERATOR_PATTERN = re.compile('|'.join(re.escape(op) for op in sorted(_OPERATORS, key=len, reverse=True)))
+
+# 关键字操作符：in / not in / #in（长度区间），需以空白与字段路径分隔，后接空白或列表字面量
+_KEYWORD_PATTERN = re.compile(r'\s+(not\s+|#)?in(?=[\s\[])')
+_KEYWORD_VALIDATORS = {None: "in_values", "#": "length_range"}
+_KEYWORD_OPERATORS = frozenset(("in", "not in", "#in"))
+
+# 列表字面量中的元素：带引号字符串或逗号分隔的普通值
+_LIST_ITEM_PATTERN = re.compile(r"""\s*('[^']*'|"[^"]*"|[^,]+)\s*(?:,|$)""")
+
+# 数字字面量：支持正负号、小数和科学计数法
+_NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+def _tokenize_rule(rule):
+    """单次扫描规则字符串，切分为 (字段路径, 校验器, 期望值字面量)
+    
+    规则中第一个出现的操作符即为规则的操作符，其后的内容整体作为期望值字面量，
+    因此期望值中包含操作符字符（如 'a>=b'）不会影响解析。
+    关键字操作符 in / not in / #in 仅在第一个符号操作符之前查找，如 "status in ['a', 'b']"、"price in 0..100"。
+    
+    :return: 没有操作符时返回 (字段路径, None, None)
+    """
+    match = _OPERATOR_PATTERN.search(rule)
+    if match is not None:
+        op = match.group()
+        start = match.start()
+        while op in _WILDCARD_OPERATORS and _is_wildcard_boundary(rule, op, start):
+            match = _OPERATOR_PATTERN.search(rule, start + 1)
+            if match is None:
+                break
+            op = match.group()
+            start = match.start()
+    # 关键字前必须有空白（#in 前为 '#'），先用子串判断排除不含关键字以及 settings、login 等路径中的 in
+    if 'in' in rule and (' in' in rule or '#in' in rule or '\tin' in rule):
+        keyword = _KEYWORD_PATTERN.search(rule, 0, start if match else len(rule))
+        if keyword:
+            validator = _KEYWORD_VALIDATORS.get(keyword.group(1), "not_in_values")
+            return rule[:keyword.start()].strip(), validator, rule[keyword.end():].strip()
+    if match is None:
+        return rule.strip(), None, None
+    return rule[:start].strip(), _OPERATORS[op], rule[start + len(op):].strip()
+
+
+# 可能与通配符 '*' 或 '==' 相邻的操作符，如 list.*==1 中路径末尾的 '*' 与 '==' 的第一个 '='
+_WILDCARD_OPERATORS = frozenset(('*=', '=*'))
+
+
+def _is_wildcard_boundary(rule, op, start):
+    """*= 的 '*' 为路径段末尾或 '=' 属于 '=='，=* 的 '=' 属于 '==' 或 '*' 为路径段开头时不是操作符"""
+    before, after = rule[start - 1:start], rule[start + 2:start + 3]
+    if op == '*=':
+        return before == '.' or after == '='
+    return before == '=' or after in ('.', '=')
+
+
+def _parse_string_rule(rule):
     """解析字符串格式的校验规则"""
-    # 支持的操作符映射 (注意：按长度排序，避免匹配冲突)
-    operators = [
-        ("#<=", "length_le"), ("#>=", "length_ge"), ("#!=", "length_ne"), ("#=", "length_eq"), ("#<", "length_lt"), ("#>", "length_gt"), ("!=", "ne"),
-        ("==", "eq"), ("<=", "le"), (">=", "ge"), ("<", "lt"), (">", "gt"),
-        ("~=", "regex"), ("^=", "startswith"), ("$=", "endswith"), ("*=", "contains"), ("=*", "contained_by"),
-        ("@=", "type_match")
-    ]
-    
-    # 尝试匹配操作符
-    for op, validator in operators:
-        if op in rule:
-            parts = rule.split(op, 1)
-            if len(parts) == 2:
-                field_path = parts[0].strip()
-                expect_value = parts[1].strip()
-                
-                # 解析期望值
-                expect_value = _parse_expect_value(expect_value)
-                
-                # 执行校验
-                return _validate_field_path(data, field_path, validator, expect_value)
+    field_path, validator, literal = _tokenize_rule(rule)
     
     # 没有操作符，默认为非空校验
-    field_path = rule.strip()
-    return _validate_field_path(data, field_path, "not_empty", True)
+    if validator is None:
+        return _Rule(rule, field_path, "not_empty", True)
+    
+    if validator == "in_values" and not literal.startswith('['):
+        # 区间字面量：price in 0..100
+        return _Rule(rule, field_path, "range", _parse_range_value(literal))
+    if validator == "length_range":
+        return _Rule(rule, field_path, validator, _parse_range_value(literal))
+    if validator in ("in_values", "not_in_values"):
+        keyword = "in" if validator == "in_values" else "not in"
+        return _Rule(rule, field_path, validator, _parse_list_value(literal, keyword))
+    
+    return _Rule(rule, field_path, validator, _parse_expect_value(literal))
 
 
-def _parse_dict_rule(data, rule):
+def _parse_dict_rule(rule):
     """解析字典格式的校验规则"""
     field_path = rule.get('field')
     validator = rule.get('validator', 'not_empty')
@@ -160,280 +504,939 @@ def _parse_dict_rule(data, rule):
     if not field_path:
         raise ValueError("字典格式校验规则必须包含'field'键")
     
-    return _validate_field_path(data, field_path, validator, expect_value)
+    if validator == "conditional_check":
+        # 条件校验：预编译条件规则和then规则，字段路径仅作为标识
+        if not isinstance(expect_value, dict) or 'condition' not in expect_value or 'then' not in expect_value:
+            raise ValueError("条件校验规则的'expect'必须包含'condition'和'then'键")
+        then_rules = expect_value['then']
+        if not isinstance(then_rules, (list, tuple)):
+            then_rules = [then_rules]
+        conditions = _compile_validation(expect_value['condition'])
+        thens = tuple(r for then_rule in then_rules for r in _compile_validation(then_rule))
+        scope = _conditional_scope(conditions + thens)
+        if not scope:
+            return _Rule(str(rule), "", validator, (conditions, thens))
+        # 条件和then规则共享通配符前缀时按元素绑定：每个元素分别判断条件并校验自身字段
+        func = _conditional_check((_rebase_rules(conditions, len(scope)), _rebase_rules(thens, len(scope))))
+        return _Rule(str(rule), ".".join(name for name, _ in scope), validator, (conditions, thens), func)
+    
+    return _Rule(str(rule), field_path, validator, expect_value)
+
+
+def _conditional_scope(rules):
+    """计算条件校验的元素作用域：所有规则路径的公共前缀截至最后一个通配符，没有时返回空元组"""
+    paths = [rule.path.segments for rule in rules]
+    scope = ()
+    for i, group in enumerate(zip(*paths)):
+        if any(segment != group[0] for segment in group):
+            break
+        if _expands(group[0]):
+            scope = paths[0][:i + 1]
+    return scope
+
+
+def _rebase_rules(rules, depth):
+    """去掉规则路径的前 depth 段，得到相对于作用域元素的规则（复用已绑定的校验函数）"""
+    return tuple(
+        _Rule(None, ".".join(name for name, _ in rule.path.segments[depth:]), rule.validator, rule.expect, rule.func)
+        for rule in rules
+    )
 
 
 def _parse_expect_value(value_str):
-    """解析期望值字符串为合适的类型"""
+    """解析期望值字面量为合适的类型
+    
+    支持带引号的字符串、整数、浮点数（含负数和科学计数法）、布尔值和 null/none，
+    其余内容按字符串处理。
+    """
     value_str = value_str.strip()
     
     # 去掉引号
-    if (value_str.startswith('"') and value_str.endswith('"')) or \
-       (value_str.startswith("'") and value_str.endswith("'")):
+    if len(value_str) >= 2 and value_str[0] in ('"', "'") and value_str[-1] == value_str[0]:
         return value_str[1:-1]
     
     # 数字
-    if value_str.isdigit():
+    if _NUMBER_PATTERN.fullmatch(value_str):
+        if '.' in value_str or 'e' in value_str or 'E' in value_str:
+            return float(value_str)
         return int(value_str)
     
-    # 浮点数
-    try:
-        if '.' in value_str:
-            return float(value_str)
-    except ValueError:
-        pass
+    lowered = value_str.lower()
     
     # 布尔值
-    if value_str.lower() in ['true', 'false']:
-        return value_str.lower() == 'true'
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
     
     # null
-    if value_str.lower() in ['null', 'none']:
+    if lowered in ('null', 'none'):
         return None
     
     # 默认返回字符串
     return value_str
 
 
-def _validate_field_path(data, field_path, validator, expect_value):
-    """校验字段路径
-    
-    :return: True表示所有字段都校验通过，False表示存在校验失败
-    """
-    # 特殊处理条件校验
-    if validator == "conditional_check":
-        condition = expect_value['condition']
-        then = expect_value['then']
-        result = _execute_validator(validator, data, expect_value, field_path)
-        if not result:
-            log_warning(f"条件校验失败: when({condition}) then({then}) | 检验结果: ✗")
-            return False
-        else:
-            log_debug(f"条件校验通过: when({condition}) then({then}) | 检验结果: ✓")
-        return True
-    
-    values = _get_values_by_path(data, field_path)
-    log_debug(f"字段路径 '{field_path}' 匹配到 {len(values)} 个值")
-    
-    for value, path in values:
-        result = _execute_validator(validator, value, expect_value, path)
-        if not result:
-            log_warning(f"校验字段 '{path}': {type(value).__name__} = {repr(value)} | 校验器: {validator} | 期望值: {repr(expect_value)} | 检验结果: ✗")
-            return False
-        else:
-            log_debug(f"校验字段 '{path}': {type(value).__name__} = {repr(value)} | 校验器: {validator} | 期望值: {repr(expect_value)} | 检验结果: ✓")
-    return True
+def _parse_list_value(value_str, keyword):
+    """解析列表字面量（如 [1, 2, 'a']），每个元素按期望值规则推断类型
+    
+    :param keyword: 规则中的关键字（in / not in），用于错误信息
+    """
+    value_str = value_str.strip()
+    if not (value_str.startswith('[') and value_str.endswith(']')):
+        raise ValueError(f"{keyword} 的期望值必须是列表，如 [1, 2, 'a']，当前值: {value_str}")
+    inner = value_str[1:-1]
+    if not inner.strip():
+        return []
+    return [_parse_expect_value(item) for item in _LIST_ITEM_PATTERN.findall(inner)]
+
+
+def _parse_range_value(value_str):
+    """解析闭区间字面量（如 0..100、-1.5..2.5），返回 (下限, 上限)"""
+    low, sep, high = value_str.strip().partition('..')
+    if not sep or not low.strip() or not high.strip():
+        raise ValueError(f"in / #in 的期望值必须是列表或区间，如 [1, 2, 'a'] 或 0..100，当前值: {value_str}")
+    return _parse_expect_value(low), _parse_expect_value(high)
+
+
+def _validate_field_path(data, rule, path=None):
+    """按预编译规则校验字段路径
+    
+    逐个取值逐个校验，遇到第一个失败即停止遍历，未访问的元素不会被展开。
+    匹配路径以父节点链的形式传递，仅在校验失败或开启调试日志时才渲染为字符串。
+    
+    :param path: data 自身的路径（父节点链），默认为根
+    :return: True表示所有字段都校验通过，False表示存在校验失败
+    :raises: TypeError: 当数据类型不匹配时
+    """
+    debug = is_enabled_for("debug")
+    if not debug and not rule.path_func:
+        # 常见情况：校验函数直接内联调用，只在失败时处理异常和输出日志
+        func = rule.func
+        for value, value_path in rule.path.iter_values(data, path):
+            try:
+                if func(value):
+                    continue
+            except Exception as e:
+                _handle_check_error(rule, value_path, e)
+            _log_check_result(rule, value, value_path, False)
+            return False
+        return True
+    
+    count = 0
+    for value, value_path in rule.path.iter_values(data, path):
+        count += 1
+        if not _check_value(rule, value, value_path, debug):
+            return False
+    
+    if debug and rule.validator != "conditional_check":
+        log_debug(f"字段路径 '{rule.field_path}' 共校验 {count} 个值")
+    return True
+
+
+def _check_value(rule, value, path, debug, failures=None):
+    """对路径匹配到的单个值执行校验并输出日志
+    
+    :param failures: 收集模式下的 _FailureSummary，失败不逐条输出，而是汇总到其中
+    :return: 校验结果
+    :raises: TypeError: 当数据类型不匹配时
+    """
+    try:
+        if rule.path_func:
+            result = rule.func(value, path)
+        else:
+            result = rule.func(value)
+    except Exception as e:
+        result = _handle_check_error(rule, path, e)
+    if not result and failures is not None:
+        failures.add(rule, value, path)
+    elif not result or debug:
+        _log_check_result(rule, value, path, result)
+    return result
+
+
+def _handle_check_error(rule, path, error):
+    """处理校验函数抛出的异常：数据类型不匹配和数据结构异常向上抛出，其他异常视为校验失败"""
+    if isinstance(error, (TypeError, AttributeError)):
+        raise TypeError(f"校验器 {rule.validator} 执行失败 [{_format_path(path)}]: {str(error)}")
+    if isinstance(error, (KeyError, IndexError, ValueError)):
+        raise error
+    return False
+
+
+def _log_check_result(rule, value, path, result):
+    """输出单个值的校验结果（失败为 warning，通过为 debug），对应级别未开启时不构建消息"""
+    if not is_enabled_for("debug" if result else "warning"):
+        return
+    validator = rule.validator
+    if validator == "conditional_check":
+        conditions, thens = rule.expect
+        condition = ", ".join(str(c) for c in conditions)
+        then = [str(t) for t in thens]
+        scope = f" [{_format_path(path)}]" if rule.field_path else ""
+        if not result:
+            log_warning(f"条件校验失败{scope}: when({condition}) then({then}) | 检验结果: ✗")
+        else:
+            log_debug(f"条件校验通过{scope}: when({condition}) then({then}) | 检验结果: ✓")
+    elif rule.quantifier is not None:
+        quantifier = _describe_quantifier(*rule.quantifier)
+        if not result:
+            log_warning(f"量词校验失败 '{_format_path(path)}': 要求{quantifier}满足 {rule} | 检验结果: ✗")
+        else:
+            log_debug(f"量词校验通过 '{_format_path(path)}': {quantifier}满足 {rule} | 检验结果: ✓")
+    elif not result:
+        log_warning(f"校验字段 '{_format_path(path)}': {type(value).__name__} = {repr(value)} | 校验器: {validator} | 期望值: {repr(rule.expect)} | 检验结果: ✗")
+    else:
+        log_debug(f"校验字段 '{_format_path(path)}': {type(value).__name__} = {repr(value)} | 校验器: {validator} | 期望值: {repr(rule.expect)} | 检验结果: ✓")
+
+
+# 收集模式下每个规则的失败汇总中保留的示例个数
+_failure_examples = 5
+
+
+def set_failure_examples(count):
+    """
+    设置收集模式（check_list_rows() 和抽样校验）下失败汇总的示例个数
+    
+    收集模式校验所有元素，同一规则的重复失败不逐条输出，而是汇总为一条日志：
+    失败次数、前 count 个失败值的路径和值、失败值的类型分布
+    
+    :param count: 示例个数，0 表示只输出失败次数和类型分布
+    """
+    global _failure_examples
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ValueError(f"示例个数必须是非负整数，当前值: {count!r}")
+    _failure_examples = count
+
+
+class _FailureSummary:
+    """按规则汇总校验失败：只保留失败次数、前几个失败示例和值类型分布，emit() 时每个规则输出一条日志"""
+    __slots__ = ('enabled', 'examples', 'rules')
+
+    def __init__(self):
+        # 失败日志未开启（或处于静默模式）时不做任何记录
+        self.enabled = is_enabled_for("warning")
+        self.examples = _failure_examples
+        # 规则 -> [失败次数, 示例 [(值的repr, 路径)], 类型分布 {类型: 次数}]，按首次失败的顺序
+        self.rules = {}
+
+    def add(self, rule, value, path):
+        if not self.enabled:
+            return
+        entry = self.rules.get(rule)
+        if entry is None:
+            entry = self.rules[rule] = [0, [], {}]
+        entry[0] += 1
+        examples = entry[1]
+        if len(examples) < self.examples:
+            examples.append((repr(value), path))
+        types = entry[2]
+        value_type = type(value)
+        types[value_type] = types.get(value_type, 0) + 1
+
+    def emit(self):
+        """输出已汇总的失败并清空"""
+        for rule, (count, examples, types) in self.rules.items():
+            distribution = ", ".join(f"{t.__name__}: {n}" for t, n in sorted(types.items(), key=lambda item: -item[1]))
+            message = f"校验失败汇总: {rule} - 共{count}个值失败 | 值类型分布: {distribution}"
+            if examples:
+                shown = ", ".join(f"'{_format_path(path)}' = {value}" for value, path in examples)
+                message += f" | 前{len(examples)}个示例: {shown}"
+            log_warning(message)
+        self.rules.clear()
+
+
+def _format_path(path):
+    """将父节点链 (父路径, 键) 渲染为可读路径，如 data.items[12].id（列表索引渲染为 [i]）"""
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    rendered = []
+    for key in reversed(keys):
+        if isinstance(key, int) and not isinstance(key, bool):
+            rendered.append(f"[{key}]")
+        elif rendered:
+            rendered.append(f".{key}")
+        else:
+            rendered.append(str(key))
+    return "".join(rendered)
+
+
+class _Path:
+    """预编译的字段路径（不可变）
+    
+    路径只在编译时切分一次，每段预先解析为 (名称, 列表索引)，通配符段为 _WILDCARD，
+    切片段（如 0:100、-5:、::100）的列表索引为 slice 对象。通配符和切片段都会展开为多个值，
+    has_wildcard / last_wildcard 对两者一视同仁。
+    列表索引支持负数（如 items.-1），也可以写成方括号形式（如 items[-1]、items[0:100]）。
+    不含通配符的路径直接逐级取值，不创建任何生成器或中间列表。
+    """
+    __slots__ = ('text', 'segments', 'has_wildcard', 'last_wildcard', 'quantified')
+
+    def __init__(self, text):
+        normalized = _BRACKET_PATTERN.sub(r'.\1', text).lstrip('.') if '[' in text else text
+        names = normalized.split('.') if normalized else ()
+        segments = tuple(_compile_segment(name) for name in names)
+        wildcards = [i for i, segment in enumerate(segments) if _expands(segment)]
+        _set = object.__setattr__
+        _set(self, 'text', text)
+        _set(self, 'segments', segments)
+        _set(self, 'has_wildcard', bool(wildcards))
+        _set(self, 'last_wildcard', wildcards[-1] if wildcards else -1)
+        # 第一个量词通配符段的位置，没有时为 -1
+        _set(self, 'quantified', next((i for i, name in enumerate(names) if _parse_quantifier(name)), -1))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"预编译路径不可修改: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"预编译路径不可修改: {name}")
+
+    def __repr__(self):
+        return f"<Path {self.text!r}>"
+
+    def resolve(self, obj, path=None):
+        """沿不含通配符的路径逐级取值，返回 (值, 路径)
+        
+        :param path: 起始对象自身的路径（父节点链），默认为根
+        """
+        for segment in self.segments:
+            name = segment[0]
+            if type(obj) is dict and name in obj:
+                obj, path = obj[name], (path, name)
+            else:
+                obj, path = _get_child(obj, path, segment)
+        return obj, path
+
+    def iter_values(self, obj, path=None):
+        """逐个产出路径匹配到的 (值, 路径)，支持通配符*
+        
+        含通配符时以逐层嵌套的生成器代替逐层构建的完整列表，内存占用与路径深度成正比，
+        调用方停止迭代后不再展开剩余元素。
+        路径为父节点链 (父路径, 键)，根为 None，需要展示时通过 _format_path() 渲染。
+        
+        :param path: 起始对象自身的路径（父节点链），默认为根
+        """
+        if not self.has_wildcard:
+            return (self.resolve(obj, path),)
+        return _walk_path(obj, path, self.segments, 0, self.last_wildcard)
+
+
+# 通配符段
+_WILDCARD = ('*', None)
+
+# 方括号形式的索引、切片或通配符（如 [0]、[-1]、[0:100]、[*]），编译时改写为点分隔的段
+_BRACKET_PATTERN = re.compile(r'\[(-?\d*(?::-?\d*){0,2}|\*)\]')
+_INDEX_PATTERN = re.compile(r'-?\d+')
+_SLICE_PATTERN = re.compile(r'(-?\d*):(-?\d*)(?::(-?\d*))?')
+
+
+def _compile_segment(name):
+    """将路径中的一段解析为 (名称, 列表索引)：索引可为负数，切片段的索引为 slice 对象"""
+    if name == '*':
+        return _WILDCARD
+    if _INDEX_PATTERN.fullmatch(name):
+        return (name, int(name))
+    if ':' in name:
+        match = _SLICE_PATTERN.fullmatch(name)
+        if match:
+            start, stop, step = (int(part) if part else None for part in match.groups())
+            if step == 0:
+                raise ValueError(f"切片步长不能为0: {name}")
+            return (name, slice(start, stop, step))
+    return (name, None)
+
+
+def _expands(segment):
+    """判断路径段是否展开为多个值（通配符或切片）"""
+    return segment is _WILDCARD or type(segment[1]) is slice
+
+# 量词通配符：*any 至少一个、*none 没有、*N+ 至少N个、*N 恰好N个，值为 (下限, 上限)
+_QUANTIFIERS = {'*any': (1, None), '*none': (0, 0)}
+_COUNT_QUANTIFIER_PATTERN = re.compile(r'\*(\d+)(\+?)')
+
+
+def _parse_quantifier(name):
+    """解析量词通配符段，返回 (下限, 上限)（上限为 None 表示不限），不是量词时返回 None"""
+    quantifier = _QUANTIFIERS.get(name)
+    if quantifier is None and name[:1] == '*':
+        match = _COUNT_QUANTIFIER_PATTERN.fullmatch(name)
+        if match:
+            count = int(match.group(1))
+            quantifier = (count, None if match.group(2) else count)
+    return quantifier
+
+
+def _describe_quantifier(low, high):
+    """生成量词描述，用于日志输出"""
+    if high is None:
+        return f"至少 {low} 个元素"
+    if high == 0:
+        return "没有元素"
+    return f"恰好 {low} 个元素"
+
+
+def _quantified(element_rule, low, high):
+    """量词校验函数：逐个元素判断是否满足元素规则，结果确定后立即停止
+    
+    *any / *N+ 满足个数达到下限即通过，*none / *N 满足个数超过上限即失败，
+    剩余元素全部满足也无法达到下限时提前失败。
+    """
+    path = element_rule.path
+    func = element_rule.func
+    
+    def check_quantified(collection):
+        if isinstance(collection, list):
+            elements = collection
+        elif isinstance(collection, dict):
+            elements = collection.values()
+        else:
+            raise TypeError(f"量词通配符只能用于列表或字典，类型: {type(collection)}")
+        remaining = len(elements)
+        count = 0
+        for element in elements:
+            remaining -= 1
+            if all(func(value) for value, _ in path.iter_values(element)):
+                count += 1
+                if high is None:
+                    if count >= low:
+                        return True
+                elif count > high:
+                    return False
+            elif count + remaining < low:
+                return False
+        return count >= low
+    return check_quantified
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(text):
+    """编译字段路径（相同路径共享同一个预编译对象）"""
+    return _Path(text)
+
+
+def _walk_path(obj, path, segments, index, last_wildcard):
+    """从路径的第 index 段开始，深度优先产出匹配到的 (值, 路径)"""
+    # 连续的普通字段段直接逐级取值，遇到通配符或切片再展开
+    segment = segments[index]
+    while segment is not _WILDCARD and type(segment[1]) is not slice:
+        obj, path = _get_child(obj, path, segment)
+        index += 1
+        segment = segments[index]
+    
+    if index == last_wildcard:
+        # 最后一个通配符，每个元素直接取值，无需再嵌套生成器
+        tail = segments[index + 1:]
+        if len(tail) == 1:
+            # 最常见情况（如 items.*.id）：通配符后只有一个字段段，省去逐元素的内层循环
+            tail_segment = tail[0]
+            name = tail_segment[0]
+            for child, child_path in _iter_expansion(obj, path, segment):
+                if type(child) is dict and name in child:
+                    yield child[name], (child_path, name)
+                else:
+                    yield _get_child(child, child_path, tail_segment)
+            return
+        for child, child_path in _iter_expansion(obj, path, segment):
+            for segment in tail:
+                name = segment[0]
+                if type(child) is dict and name in child:
+                    child, child_path = child[name], (child_path, name)
+                else:
+                    child, child_path = _get_child(child, child_path, segment)
+            yield child, child_path
+    else:
+        for child, child_path in _iter_expansion(obj, path, segment):
+            yield from _walk_path(child, child_path, segments, index + 1, last_wildcard)
+
+
+def _iter_expansion(current_obj, current_path, segment):
+    """返回通配符或切片段在当前对象上匹配到的 (值, 路径) 迭代器"""
+    if segment is _WILDCARD:
+        return _iter_wildcard(current_obj, current_path)
+    return _iter_slice(current_obj, current_path, segment)
+
+
+def _iter_slice(current_obj, current_path, segment):
+    """返回切片段在列表上匹配到的 (值, 路径) 迭代器：按下标逐个取值，不复制列表（类型不匹配时立即报错）
+    
+    在字典上按普通键取值（如 sched.10:30 中的 "10:30"），与负数索引段在字典上的处理一致。
+    """
+    name, bounds = segment
+    if isinstance(current_obj, dict):
+        return iter((_get_child(current_obj, current_path, segment),))
+    if not isinstance(current_obj, list):
+        raise TypeError(f"切片'{name}'只能用于列表，路径: {_format_path(current_path)}, 类型: {type(current_obj)}")
+    return ((current_obj[i], (current_path, i)) for i in range(*bounds.indices(len(current_obj))))
+
+
+def _iter_wildcard(current_obj, current_path):
+    """返回通配符'*'在当前对象上匹配到的 (值, 路径) 迭代器（类型不匹配时立即报错）"""
+    if isinstance(current_obj, list):
+        return ((item, (current_path, i)) for i, item in enumerate(current_obj))
+    elif isinstance(current_obj, dict):
+        return ((value, (current_path, key)) for key, value in current_obj.items())
+    else:
+        raise TypeError(f"通配符'*'只能用于列表或字典，路径: {_format_path(current_path)}, 类型: {type(current_obj)}")
+
+
+def _get_child(current_obj, current_path, segment):
+    """获取路径中一个普通字段段（字典键或列表索引）对应的 (值, 路径)"""
+    name, index = segment
+    if isinstance(current_obj, dict):
+        if name not in current_obj:
+            raise KeyError(f"字段不存在: {_format_path((current_path, name))}")
+        return current_obj[name], (current_path, name)
+    elif isinstance(current_obj, list):
+        if index is None:
+            raise ValueError(f"列表索引必须是数字: {name}")
+        size = len(current_obj)
+        if index < 0:
+            # 负数索引从末尾计数，路径中记录实际位置
+            index += size
+            if index < 0:
+                raise IndexError(f"索引超出范围: {_format_path((current_path, name))}")
+        elif index >= size:
+            raise IndexError(f"索引超出范围: {_format_path((current_path, index))}")
+        return current_obj[index], (current_path, index)
+    else:
+        raise TypeError(f"无法在{type(current_obj)}上访问字段: {name}")
+
+
+"""
+路径前缀树 - 共享路径前缀的规则只遍历一次
+"""
+
+class _RuleError(Exception):
+    """规则执行时的数据结构异常，记录出错规则的序号"""
+
+    def __init__(self, index, error):
+        super().__init__(str(error))
+        self.index = index
+        self.error = error
+
+
+class _TrieNode:
+    """前缀树节点：keys 为 ((字段段, 子节点), ...)，wildcard 为通配符子节点，slices 为 ((切片段, 子节点), ...)，
+    rules 为路径在此结束的规则序号，rule_ids 为子树中全部规则序号（升序），leaf 表示没有子节点"""
+    __slots__ = ('id', 'keys', 'wildcard', 'slices', 'rules', 'rule_ids', 'leaf')
+
+    def __init__(self, node_id):
+        self.id = node_id
+        self.keys = {}
+        self.wildcard = None
+        self.slices = {}
+        self.rules = []
+        self.rule_ids = []
+        self.leaf = True
+
+
+class _PrefixTrie:
+    """规则路径前缀树（构建后不再修改，可在多个线程间共享）
+    
+    共享前缀（如 data.productList.*）的规则挂在同一子树下，遍历数据时每个前缀只展开一次，
+    并在同一个元素上依次校验挂在其下的所有规则，遍历开销取决于数据规模而非数据规模 × 规则数。
+    """
+    __slots__ = ('rules', 'root', 'live', 'rule_nodes')
+
+    def __init__(self, rules):
+        self.rules = rules
+        nodes = [_TrieNode(0)]
+        rule_nodes = []
+        for index, rule in enumerate(rules):
+            node = nodes[0]
+            path_nodes = [node]
+            for segment in rule.path.segments:
+                if segment is _WILDCARD:
+                    child = node.wildcard
+                    if child is None:
+                        child = node.wildcard = _TrieNode(len(nodes))
+                        nodes.append(child)
+                elif type(segment[1]) is slice:
+                    # slice 对象不可哈希，按切片文本归并
+                    entry = node.slices.get(segment[0])
+                    if entry is None:
+                        entry = node.slices[segment[0]] = (segment, _TrieNode(len(nodes)))
+                        nodes.append(entry[1])
+                    child = entry[1]
+                else:
+                    child = node.keys.get(segment)
+                    if child is None:
+                        child = node.keys[segment] = _TrieNode(len(nodes))
+                        nodes.append(child)
+                node.leaf = False
+                node = child
+                path_nodes.append(node)
+            node.rules.append(index)
+            for path_node in path_nodes:
+                path_node.rule_ids.append(index)
+            rule_nodes.append(tuple(path_node.id for path_node in path_nodes))
+        
+        for node in nodes:
+            node.keys = tuple(node.keys.items())
+            node.slices = tuple(node.slices.values())
+            node.rules = tuple(node.rules)
+            node.rule_ids = tuple(node.rule_ids)
+        self.root = nodes[0]
+        # 每个节点下尚未失败的规则数，遍历时复制一份作为本次遍历的状态
+        self.live = [len(node.rule_ids) for node in nodes]
+        self.rule_nodes = tuple(rule_nodes)
+
+    def run(self, data):
+        """遍历一次数据，返回每个规则的校验结果
+        
+        :raises: _RuleError: 当某个规则遇到数据结构异常时
+        """
+        if len(self.rules) == 1:
+            # 单个规则没有可共享的前缀，直接流式遍历
+            try:
+                return [_validate_field_path(data, self.rules[0])]
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                raise _RuleError(0, e)
+        walk = _TrieWalk(self)
+        if self.rules:
+            walk.visit(self.root, data, None)
+        return walk.results
+
+
+class _TrieWalk:
+    """单次前缀树遍历的状态：规则失败后从所在路径的各节点计数中扣除，计数归零的子树不再展开"""
+    __slots__ = ('trie', 'rules', 'results', 'live', 'debug')
+
+    def __init__(self, trie):
+        self.trie = trie
+        self.rules = trie.rules
+        self.results = [True] * len(trie.rules)
+        self.live = list(trie.live)
+        self.debug = is_enabled_for("debug")
+
+    def visit(self, node, obj, path):
+        live = self.live
+        if node.rules:
+            self.evaluate(node.rules, obj, path)
+        for segment, child in node.keys:
+            if not live[child.id]:
+                continue
+            name = segment[0]
+            if type(obj) is dict and name in obj:
+                value, child_path = obj[name], (path, name)
+            else:
+                try:
+                    value, child_path = _get_child(obj, path, segment)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    raise self.error(child, e)
+            if not child.leaf:
+                self.visit(child, value, child_path)
+            else:
+                # 叶子节点直接校验，无需再进入下一层
+                self.evaluate(child.rules, value, child_path)
+        child = node.wildcard
+        if child is not None and live[child.id]:
+            self.expand(child, obj, path, _WILDCARD)
+        for segment, child in node.slices:
+            if live[child.id]:
+                self.expand(child, obj, path, segment)
+
+    def expand(self, child, obj, path, segment):
+        """展开通配符或切片段，逐个元素进入子节点，子树中的规则全部失败后停止"""
+        live = self.live
+        try:
+            items = _iter_expansion(obj, path, segment)
+        except TypeError as e:
+            raise self.error(child, e)
+        child_id = child.id
+        if not child.leaf:
+            for value, child_path in items:
+                self.visit(child, value, child_path)
+                if not live[child_id]:
+                    break
+        else:
+            rules = child.rules
+            for value, child_path in items:
+                self.evaluate(rules, value, child_path)
+                if not live[child_id]:
+                    break
+
+    def evaluate(self, indexes, value, path):
+        """在同一个值上依次校验路径在此结束且尚未失败的规则"""
+        results = self.results
+        rules = self.rules
+        for index in indexes:
+            if results[index]:
+                rule = rules[index]
+                try:
+                    if rule.path_func:
+                        # 条件校验需要元素路径，then 规则的日志显示完整路径
+                        result = rule.func(value, path)
+                    else:
+                        result = rule.func(value)
+                except Exception as e:
+                    result = self.handle_error(index, path, e)
+                if not result or self.debug:
+                    self.settle(index, value, path, result)
+
+    def handle_error(self, index, path, error):
+        try:
+            return _handle_check_error(self.rules[index], path, error)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise _RuleError(index, e)
+
+    def settle(self, index, value, path, result):
+        """输出校验结果；规则失败时从其路径上各节点的计数中扣除"""
+        _log_check_result(self.rules[index], value, path, result)
+        if not result:
+            self.results[index] = False
+            live = self.live
+            for node_id in self.trie.rule_nodes[index]:
+                live[node_id] -= 1
+
+    def error(self, node, error):
+        """将数据结构异常归属到该子树下第一个尚未失败的规则"""
+        index = next(i for i in node.rule_ids if self.results[i])
+        return _RuleError(index, error)
+
+
+# 类型名称映射（不区分大小写），number 表示 int 或 float
+_TYPE_NAMES = {
+    'int': int,
+    'integer': int,
+    'float': float,
+    'number': (int, float),
+    'str': str,
+    'string': str,
+    'bool': bool,
+    'boolean': bool,
+    'list': list,
+    'dict': dict,
+    'tuple': tuple,
+    'set': set,
+    'frozenset': frozenset,
+    'bytes': bytes,
+    'nonetype': type(None),
+    'none': type(None),
+    'null': type(None)
+}
+
+
+def _resolve_type(expect_value):
+    """将期望类型解析为类型元组
+    
+    :param expect_value: 类型对象、类型元组或类型名称字符串（None 表示 NoneType）
+    :return: (类型元组, 是否排除bool) - 期望整数/数字但未显式包含bool时，True/False 不视为整数
+    :raises: ValueError: 当类型名称不支持时
+    """
+    if expect_value is None:
+        types = (type(None),)
+    elif isinstance(expect_value, type):
+        types = (expect_value,)
+    elif isinstance(expect_value, tuple) and expect_value and all(isinstance(t, type) for t in expect_value):
+        types = expect_value
+    elif isinstance(expect_value, str):
+        resolved = _TYPE_NAMES.get(expect_value.strip().lower())
+        if resolved is None:
+            raise ValueError(f"不支持的类型名称: {expect_value}")
+        types = resolved if isinstance(resolved, tuple) else (resolved,)
+    else:
+        raise ValueError(f"期望值必须是类型对象或类型名称字符串，当前类型: {type(expect_value)}")
+    return types, int in types and bool not in types
+
+
+"""
+校验器注册表 - 规则解析时将校验器名称解析为校验函数，逐值校验时不再做字符串匹配
+"""
+
+def _not_empty(expect_value):
+    return _is_not_empty
+
+
+def _is_not_empty(value):
+    """非空判断，与 is_empty_value() 的规则一致，但不构建原因说明"""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        stripped = value.strip()
+        return stripped != '' and stripped.lower() != 'null'
+    if isinstance(value, (list, dict)):
+        return len(value) > 0
+    return True
+
+
+def _reflected(op):
+    """二元比较：partial(op, expect_value)(check_value) 即 op(expect_value, check_value)"""
+    return lambda expect_value: partial(op, expect_value)
+
+
+def _contains(expect_value):
+    return lambda check_value: expect_value in check_value
+
+
+def _startswith(expect_value):
+    prefix = str(expect_value)
+    return lambda check_value: str(check_value).startswith(prefix)
+
+
+def _endswith(expect_value):
+    suffix = str(expect_value)
+    return lambda check_value: str(check_value).endswith(suffix)
+
+
+def _regex(mode):
+    """正则校验：规则解析时预编译正则，mode 为 match / fullmatch / search"""
+    def factory(expect_value):
+        if isinstance(expect_value, _PATTERN_TYPE):
+            compiled = expect_value
+        else:
+            try:
+                compiled = re.compile(str(expect_value))
+            except re.error as e:
+                raise ValueError(f"正则表达式无效: {str(e)}")
+        matcher = getattr(compiled, mode)
+        return lambda check_value: matcher(str(check_value)) is not None
+    return factory
+
+
+def _type_match(expect_value):
+    types, exclude_bool = _resolve_type(expect_value)
+    if len(types) == 1:
+        types = types[0]
+    if exclude_bool:
+        return lambda check_value: isinstance(check_value, types) and check_value.__class__ is not bool
+    return lambda check_value: isinstance(check_value, types)
 
 
-def _get_values_by_path(obj, path):
-    """根据路径获取值，支持通配符*"""
-    if not path:
-        return [(obj, "")]
-    
-    parts = path.split('.')
-    current_objects = [(obj, "")]
-    
-    for part in parts:
-        next_objects = []
-        for current_obj, current_path in current_objects:
-            new_path = f"{current_path}.{part}" if current_path else part
-            
-            if part == '*':
-                if isinstance(current_obj, list):
-                    for i, item in enumerate(current_obj):
-                        next_objects.append((item, f"{current_path}[{i}]" if current_path else f"[{i}]"))
-                elif isinstance(current_obj, dict):
-                    for key, value in current_obj.items():
-                        next_objects.append((value, f"{current_path}.{key}" if current_path else key))
-                else:
-                    raise TypeError(f"通配符'*'只能用于列表或字典，路径: {current_path}, 类型: {type(current_obj)}")
-            else:
-                if isinstance(current_obj, dict):
-                    if part not in current_obj:
-                        raise KeyError(f"字段不存在: {new_path}")
-                    next_objects.append((current_obj[part], new_path))
-                elif isinstance(current_obj, list):
-                    if not part.isdigit():
-                        raise ValueError(f"列表索引必须是数字: {part}")
-                    index = int(part)
-                    if index < 0 or index >= len(current_obj):
-                        raise IndexError(f"索引超出范围: {new_path}")
-                    next_objects.append((current_obj[index], f"{current_path}[{index}]" if current_path else f"[{index}]"))
-                else:
-                    raise TypeError(f"无法在{type(current_obj)}上访问字段: {part}")
-        current_objects = next_objects
-    
-    return current_objects
-
-
-def _check_type_match(check_value, expect_value):
-    """检查值的类型是否匹配期望类型
-    
-    :param check_value: 要检查的值
-    :param expect_value: 期望的类型，可以是类型对象或类型名称字符串
-    :return: True表示类型匹配，False表示类型不匹配
-    """
-    def get_type(name):
-        """根据名称获取类型对象"""
-        if isinstance(name, type):
-            return name
-        elif isinstance(name, str):
-            # 支持常见的类型名称
-            type_mapping = {
-                'int': int,
-                'float': float,
-                'str': str,
-                'string': str,
-                'bool': bool,
-                'boolean': bool,
-                'list': list,
-                'dict': dict,
-                'tuple': tuple,
-                'set': set,
-                'nonetype': type(None),
-                'none': type(None),
-                'null': type(None)
-            }
-            
-            # 先检查自定义映射
-            if name.lower() in type_mapping:
-                return type_mapping[name.lower()]
-            
-            # 尝试从内置类型获取
+def _membership(negate):
+    """集合成员校验：可哈希的集合在规则解析时转换为 frozenset，逐值判断为 O(1)"""
+    def factory(expect_value):
+        lookup = expect_value
+        if isinstance(expect_value, (list, tuple, set)):
             try:
-                return eval(name)
-            except:
-                raise ValueError(f"不支持的类型名称: {name}")
-        else:
-            raise ValueError(f"期望值必须是类型对象或类型名称字符串，当前类型: {type(expect_value)}")
-    
-    try:
-        expected_type = get_type(expect_value)
-        return isinstance(check_value, expected_type)
-    except Exception as e:
-        raise TypeError(f"类型匹配检查失败: {str(e)}")
+                lookup = frozenset(expect_value)
+            except TypeError:
+                # 集合中包含不可哈希的值，保持原有的线性查找
+                pass
+        
+        def check_membership(check_value):
+            try:
+                found = check_value in lookup
+            except TypeError:
+                # 待校验值不可哈希，回退到原始集合的线性查找
+                found = check_value in expect_value
+            return found is not negate
+        return check_membership
+    return factory
+
+
+def _length(op):
+    """长度比较：op(len(check_value), expect_value)"""
+    def factory(expect_value):
+        return lambda check_value: op(len(check_value), expect_value)
+    return factory
+
+
+def _range_bounds(expect_value):
+    """解析区间期望值 (下限, 上限) 或 (下限, 上限, 是否包含边界)，默认包含边界"""
+    if not isinstance(expect_value, (list, tuple)) or len(expect_value) not in (2, 3):
+        raise ValueError("区间期望值必须是 (下限, 上限) 或 (下限, 上限, 是否包含边界)")
+    low, high = expect_value[0], expect_value[1]
+    inclusive = expect_value[2] if len(expect_value) == 3 else True
+    if low > high:
+        raise ValueError(f"区间下限 {low!r} 大于上限 {high!r}")
+    return low, high, inclusive
+
+
+def _range(expect_value):
+    """数值区间：一次链式比较同时校验上下限"""
+    low, high, inclusive = _range_bounds(expect_value)
+    if inclusive:
+        return lambda check_value: low <= check_value <= high
+    return lambda check_value: low < check_value < high
+
 
+def _length_range(expect_value):
+    """长度区间：只计算一次长度，同时校验上下限"""
+    low, high, inclusive = _range_bounds(expect_value)
+    if inclusive:
+        return lambda check_value: low <= len(check_value) <= high
+    return lambda check_value: low < len(check_value) < high
 
-def _execute_validator(validator, check_value, expect_value, field_path):
-    """执行具体的校验
+
+def _conditional_check(expect_value):
+    # 条件校验逻辑 - 复用预编译的条件规则和then规则
+    condition_rules, then_rules = expect_value
+    
+    def check_conditional(check_value, path=None):
+        # 执行条件判断（多条条件规则需全部满足），条件不满足是正常分支，不输出日志
+        for condition_rule in condition_rules:
+            if not _condition_met(check_value, condition_rule, path):
+                # 条件不满足，跳过校验（返回True）
+                return True
+        
+        # 条件满足，执行then校验（路径从作用域元素开始），全部校验通过才算成功
+        for then_rule in then_rules:
+            if not _validate_field_path(check_value, then_rule, path):
+                return False
+        return True
+    return check_conditional
+
+
+def _condition_met(data, rule, path):
+    """判断条件规则是否满足，不输出日志
     
-    :return: True表示校验通过，False表示校验失败
-    :raises: ValueError: 当校验器不支持时
-    :raises: TypeError: 当数据类型不匹配时
+    :raises: TypeError / KeyError 等: 与普通校验相同，数据类型不匹配或数据结构异常时抛出
     """
-    try:
-        if validator == "not_empty":
-            is_empty, reason = is_empty_value(check_value)
-            return not is_empty
-        
-        elif validator == "eq":
-            return check_value == expect_value
-        
-        elif validator == "ne":
-            return check_value != expect_value
-        
-        elif validator == "gt":
-            return check_value > expect_value
-        
-        elif validator == "ge":
-            return check_value >= expect_value
-        
-        elif validator == "lt":
-            return check_value < expect_value
-        
-        elif validator == "le":
-            return check_value <= expect_value
-        
-        elif validator == "contains":
-            return expect_value in check_value
-        
-        elif validator == "contained_by":
-            return check_value in expect_value
-        
-        elif validator == "startswith":
-            return str(check_value).startswith(str(expect_value))
-        
-        elif validator == "endswith":
-            return str(check_value).endswith(str(expect_value))
-        
-        elif validator == "regex":
-            import re
-            try:
-                return bool(re.match(str(expect_value), str(check_value)))
-            except re.error:
+    for value, value_path in rule.path.iter_values(data, path):
+        try:
+            if not rule.func(value):
                 return False
-        
-        elif validator == "type_match":
-            return _check_type_match(check_value, expect_value)
-        
-        elif validator == "custom_number_check":
-            return isinstance(check_value, (int, float))
-        
-        elif validator == "in_values":
-            return check_value in expect_value
-        
-        elif validator == "not_in_values":
-            return check_value not in expect_value
-        
-        elif validator == "length_eq":
-            return len(check_value) == expect_value
-        
-        elif validator == "length_ne":
-            return len(check_value) != expect_value
-        
-        elif validator == "length_gt":
-            return len(check_value) > expect_value
-        
-        elif validator == "length_ge":
-            return len(check_value) >= expect_value
+        except Exception as e:
+            return _handle_check_error(rule, value_path, e)
+    return True
 
-        elif validator == "length_lt":
-            return len(check_value) < expect_value
-        
-        elif validator == "length_le":
-            return len(check_value) <= expect_value
 
-        elif validator == "length_between":
-            min_len, max_len = expect_value
-            return min_len <= len(check_value) <= max_len
-        
-        elif validator == "conditional_check":
-            # 条件校验逻辑 - 复用现有的解析和校验逻辑
-            condition_rule = expect_value['condition']
-            then_rules = expect_value['then']
-            
-            # 解析并执行条件校验
-            condition_result = _parse_and_validate(check_value, condition_rule)
-            
-            # 如果条件满足，执行then校验
-            if condition_result:
-                # 支持单个then校验或多个then校验
-                if isinstance(then_rules, list):
-                    # 多个then校验，全部校验通过才算成功
-                    for then_rule in then_rules:
-                        if not _parse_and_validate(check_value, then_rule):
-                            return False
-                    return True
-                else:
-                    # 单个then校验（即字典格式条件校验时then为字符串）
-                    return _parse_and_validate(check_value, then_rules)
-            
-            # 条件不满足，跳过校验（返回True）
-            return True
-        
-        else:
-            raise ValueError(f"不支持的校验器: {validator}")
+# 校验器名称 -> 工厂函数（接收期望值，返回只接收待校验值的校验函数）
+_VALIDATORS = {
+    "not_empty": _not_empty,
+    "eq": _reflected(operator.eq),
+    "ne": _reflected(operator.ne),
+    "gt": _reflected(operator.lt),
+    "ge": _reflected(operator.le),
+    "lt": _reflected(operator.gt),
+    "le": _reflected(operator.ge),
+    "contains": _contains,
+    "contained_by": _reflected(operator.contains),
+    "startswith": _startswith,
+    "endswith": _endswith,
+    "regex": _regex("match"),
+    "regex_fullmatch": _regex("fullmatch"),
+    "regex_search": _regex("search"),
+    "type_match": _type_match,
+    "custom_number_check": lambda expect_value: _type_match('number'),
+    "in_values": _membership(negate=False),
+    "not_in_values": _membership(negate=True),
+    "length_eq": _length(operator.eq),
+    "length_ne": _length(operator.ne),
+    "length_gt": _length(operator.gt),
+    "length_ge": _length(operator.ge),
+    "length_lt": _length(operator.lt),
+    "length_le": _length(operator.le),
+    "range": _range,
+    "length_range": _length_range,
+    "length_between": _length_range,
+    "conditional_check": _conditional_check,
+}
+
+
+def _resolve_validator(validator, expect_value):
+    """将校验器名称和期望值解析为校验函数
     
-    except (TypeError, AttributeError) as e:
-        # 数据类型不匹配等异常，向上抛出
-        raise TypeError(f"校验器 {validator} 执行失败 [{field_path}]: {str(e)}")
-    except Exception as e:
-        if isinstance(e, (KeyError, IndexError, ValueError)):
-            # 数据结构异常，向上抛出
-            raise
-        else:
-            # 其他异常转换为校验失败
-            return False
+    :raises: ValueError: 当校验器不支持或期望值不合法时
+    """
+    factory = _VALIDATORS.get(validator)
+    if factory is None:
+        raise ValueError(f"不支持的校验器: {validator}")
+    try:
+        return factory(expect_value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"校验器 {validator} 的期望值不合法: {repr(expect_value)} - {str(e)}")
 
 
 def check_not_empty(data, *field_paths):
@@ -441,13 +1444,14 @@ def check_not_empty(data, *field_paths):
     return check(data, *field_paths)
 
 
-def check_when(data, condition, *then):
+def check_when(data, condition, *then, quiet=False):
     """
     条件校验 - 当条件满足时执行then校验（支持批量校验）
     
     :param data: 要校验的数据
     :param condition: 条件表达式，支持所有校验器语法
     :param then: then表达式，支持所有校验器语法，可传入多个校验规则
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志
     :return: True表示校验通过，False表示校验失败
     :raises: Exception: 当参数错误或数据结构异常时抛出异常
     
@@ -465,7 +1469,7 @@ def check_when(data, condition, *then):
                "description",
                "category != 'test'")
     
-    # 支持通配符 - 当所有产品状态为active时，价格都必须大于0且名称不能为空
+    # 按元素校验 - 每个状态为active的产品，其价格必须大于0且名称不能为空
     check_when(data, "products.*.status == 'active'", 
                "products.*.price > 0", 
                "products.*.name")
@@ -476,10 +1480,15 @@ def check_when(data, condition, *then):
                "user.permissions.upload == true", 
                "user.quota > 1000")
     
+    # 预编译规则 - 条件和then均可传入 compile_rules() 的结果
+    check_when(data, compile_rules("status == 'active'"), compile_rules("price > 0", "name"))
+    
     注意：
     1. 当条件满足时，所有then校验都必须通过才算成功
     2. 当条件不满足时，跳过所有then校验（返回True）
-    3. 日志输出级别可通过项目的 --log-level 参数控制
+    3. 条件和then规则共享通配符前缀（如 products.*）时按元素绑定，一次遍历列表，
+       每个元素分别判断条件并校验自身字段；不共享时条件和then规则作用于整个数据
+    4. 日志输出级别可通过项目的 --log-level 参数控制
     """
     
     # 参数验证
@@ -495,15 +1504,19 @@ def check_when(data, condition, *then):
             'then': list(then)
         }
     }
-    return check(data, conditional_rule)
+    return check(data, conditional_rule, quiet=quiet)
+
 
+ListCheckResult = namedtuple('ListCheckResult', ['passed', 'failed_rows', 'row_results'])
 
-def check_list(data_list, *field_names, **validators):
+
+def check_list(data_list, *field_names, quiet=False, **validators):
     """
     列表数据批量校验 - 简化版
     
     :param data_list: 数据列表
     :param field_names: 字段名（默认非空校验，同时支持符号表达式校验和字典格式参数校验）
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志（名为 quiet 的字段请使用 "quiet ..." 字符串规则）
     :param validators: 带校验器的字段 field_name="validator expression"}
     :return: True表示所有校验通过，False表示存在校验失败
     :raises: Exception: 当参数错误或数据结构异常时抛出异常
@@ -522,40 +1535,125 @@ def check_list(data_list, *field_names, **validators):
     或
     check_list(productList, "name", "description", "id > 0", "status == 'active'")
     
-    注意：日志输出级别可通过项目的 --log-level 参数控制
+    # 预编译规则 - 规则路径相对于列表元素
+    row_plan = compile_rules("id > 0", "name")
+    check_list(productList, row_plan)
+    
+    注意：
+    1. 列表只遍历一次，每一行依次校验所有字段规则，遇到第一个失败的行即停止；
+       之后的行不再访问，其中缺少字段等数据结构异常不会抛出（返回 False）
+    2. 需要逐行结果时使用 check_list_rows()，它会访问所有行
+    3. 日志输出级别可通过项目的 --log-level 参数控制
+    """
+    if quiet:
+        with silent():
+            return check_list(data_list, *field_names, **validators)
+    return _check_rows(data_list, field_names, validators, collect=False).passed
+
+
+def check_list_rows(data_list, *field_names, quiet=False, **validators):
+    """
+    列表数据逐行校验 - 参数与 check_list() 相同，返回每一行的校验结果
+    
+    :return: ListCheckResult(passed, failed_rows, row_results)
+             passed 表示所有行都通过，failed_rows 为失败行的索引元组，
+             row_results 为与列表等长的布尔元组（逐行通过标记）
+    :raises: Exception: 当参数错误或数据结构异常时抛出异常
+    
+    示例：
+    result = check_list_rows(orders, "id > 0", "sku", qty="> 0")
+    good_rows = [row for row, ok in zip(orders, result.row_results) if ok]
+    bad_rows = [orders[i] for i in result.failed_rows]
+    
+    注意：所有行都会校验，同一规则的失败汇总为一条日志（失败次数、示例和值类型分布），示例个数见 set_failure_examples()
     """
+    if quiet:
+        with silent():
+            return check_list_rows(data_list, *field_names, **validators)
+    return _check_rows(data_list, field_names, validators, collect=True)
+
+
+def _check_rows(data_list, field_names, validators, collect):
+    """逐行校验列表数据：列表只遍历一次，每一行依次校验所有字段规则
     
+    :param collect: True 时校验所有行并记录逐行结果，False 时遇到第一个失败的行即停止
+    """
     total_fields = len(field_names) + len(validators)
-    log_info(f"列表数据批量校验 - 列表长度: {len(data_list) if isinstance(data_list, list) else '未知'}, 字段数: {total_fields}")
-    log_debug(f"非空校验字段: {list(field_names)}")
-    log_debug(f"带校验器字段: {dict(validators)}")
+    log_info("列表数据批量校验 - 列表长度: %s, 字段数: %d", len(data_list) if isinstance(data_list, list) else '未知', total_fields)
+    debug = is_enabled_for("debug")
+    if debug:
+        log_debug(f"非空校验字段: {list(field_names)}")
+        log_debug(f"带校验器字段: {dict(validators)}")
     
     if not isinstance(data_list, list):
         raise TypeError(f"data_list必须是列表，当前类型: {type(data_list)}")
     
-    # 构建校验规则
-    rules = []
-    
-    # 默认非空校验的字段
-    for field in field_names:
-        rules.append(f"*.{field}")
-    
-    # 带校验器的字段
-    for field, validator_expr in validators.items():
-        rules.append(f"*.{field} {validator_expr}")
+    # 构建校验规则（规则路径相对于列表元素）
+    rules = _list_rules(field_names, validators)
+    
+    # 收集模式下同一规则的失败汇总输出，不逐行输出
+    failures = _FailureSummary() if collect else None
+    row_results = []
+    failed_rows = []
+    for row_index, row in enumerate(data_list):
+        passed = _check_row(rules, row, row_index, debug, failures)
+        row_results.append(passed)
+        if not passed:
+            failed_rows.append(row_index)
+            if not collect:
+                break
+    
+    if failures is not None:
+        failures.emit()
+    if failed_rows and not collect:
+        log_info("列表数据校验完成: 第%d行校验失败，停止校验剩余行", failed_rows[0])
+    else:
+        log_info("列表数据校验完成: %d/%d 行通过", len(row_results) - len(failed_rows), len(row_results))
+    return ListCheckResult(not failed_rows, tuple(failed_rows), tuple(row_results))
+
+
+def _list_rules(field_names, validators):
+    """将 check_list 风格的参数编译为规则（规则路径相对于列表元素）"""
+    validations = list(field_names)
+    validations.extend(f"{field} {validator_expr}" for field, validator_expr in validators.items())
+    return _compile_validations(validations)
+
+
+def _check_row(rules, row, row_index, debug, failures=None):
+    """在一行数据上依次校验所有规则，非收集模式下遇到第一个失败的规则即停止
     
-    # 执行校验
-    return check(data_list, *rules)
+    :param failures: 收集模式下的 _FailureSummary：该行所有规则的所有值都会校验，
+                     失败汇总到其中，不逐行输出，汇总中的失败次数因此是准确的值个数
+    :return: True表示该行所有规则通过
+    :raises: Exception: 当数据结构异常时抛出异常
+    """
+    row_path = (None, row_index)
+    passed = True
+    for rule in rules:
+        try:
+            for value, path in rule.path.iter_values(row, row_path):
+                if not _check_value(rule, value, path, debug, failures):
+                    if failures is None:
+                        log_warning("[第%d行] 校验失败: %s ✗", row_index, rule)
+                        return False
+                    passed = False
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # 数据结构异常，抛出异常
+            error_msg = f"数据结构异常: {rule} - {str(e)}"
+            log_error(f"[第{row_index}行] ❌ {error_msg}")
+            raise Exception(error_msg)
+    return passed
 
 
-def check_nested(data, list_path, nested_field, *field_validations):
+def check_nested(data, list_path, nested_field, *field_validations, quiet=False):
     """
     嵌套列表数据批量校验 - 简化版
     
     :param data: 要校验的数据
     :param list_path: 主列表路径
-    :param nested_field: 嵌套字段名
-    :param field_validations: 字段校验规则
+    :param nested_field: 嵌套字段名，多级嵌套用点分隔（如 "lines.allocations"）
+    :param field_validations: 字段校验规则，路径相对于最内层的嵌套元素
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志
     :return: True表示所有校验通过，False表示存在校验失败
     :raises: Exception: 当参数错误或数据结构异常时抛出异常
     
@@ -565,154 +1663,456 @@ def check_nested(data, list_path, nested_field, *field_validations):
     
     # 带校验器
     check_nested(response, "data.productList", "purchasePlan", "id > 0", "amount >= 100")
+    
+    # 多级嵌套 - orders → lines → allocations
+    check_nested(data, "orders", "lines.allocations", "warehouse", "qty > 0")
+    
+    注意：
+    1. 每一级嵌套字段的形态按元素分别判断：列表逐项校验，字典直接校验
+    2. 一次遍历完成校验，遇到第一个失败即停止；之后的元素不再访问，
+       其中缺少字段等数据结构异常不会抛出（返回 False）
     """
+    if quiet:
+        with silent():
+            return check_nested(data, list_path, nested_field, *field_validations)
     
-    log_info(f"嵌套列表数据批量校验 - 路径: {list_path}.*.{nested_field}, 字段数: {len(field_validations)}")
-    log_debug(f"主列表路径: {list_path}")
-    log_debug(f"嵌套字段名: {nested_field}")
-    log_debug(f"字段校验规则: {list(field_validations)}")
+    log_info("嵌套列表数据批量校验 - 路径: %s.*.%s, 字段数: %d", list_path, nested_field, len(field_validations))
+    debug = is_enabled_for("debug")
+    if debug:
+        log_debug(f"主列表路径: {list_path}")
+        log_debug(f"嵌套字段名: {nested_field}")
+        log_debug(f"字段校验规则: {list(field_validations)}")
     
-    main_list_value = get_nested_value(data, list_path)
-    if isinstance(main_list_value, list) and len(main_list_value) > 0:
-        nested_field_value = main_list_value[0][nested_field]
+    main_list_value, main_list_path = _compile_path(list_path).resolve(data)
+    if not isinstance(main_list_value, list):
+        raise ValueError(f"主列表路径 {list_path} 的值不是列表")
+    
+    rules = _compile_validations(field_validations)
+    levels = tuple(nested_field.split('.'))
+    checked = 0
+    
+    try:
+        for i, item in enumerate(main_list_value):
+            for target, target_path in _iter_nested(item, (main_list_path, i), levels, 0):
+                checked += 1
+                for rule in rules:
+                    for value, path in rule.path.iter_values(target, target_path):
+                        if not _check_value(rule, value, path, debug):
+                            if is_enabled_for("warning"):
+                                log_warning(f"嵌套校验失败: {rule} [{_format_path(target_path)}] ✗")
+                            return False
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        # 数据结构异常，抛出异常
+        error_msg = f"数据结构异常: {list_path}.*.{nested_field} - {str(e)}"
+        log_error(f"❌ {error_msg}")
+        raise Exception(error_msg)
+    
+    log_info("嵌套列表数据校验完成: 共 %d 个嵌套元素通过", checked)
+    return True
+
+
+def _iter_nested(obj, path, levels, index):
+    """逐级展开嵌套字段，逐个元素判断形态：列表展开每一项，字典作为单个元素"""
+    value, path = _get_child(obj, path, (levels[index], None))
+    if isinstance(value, list):
+        items = ((item, (path, i)) for i, item in enumerate(value))
+    elif isinstance(value, dict):
+        items = ((value, path),)
     else:
-        raise ValueError(f"主列表路径 {list_path} 的值不是列表或为空列表")
+        raise ValueError(f"嵌套字段 {_format_path(path)} 的值不是列表或字典")
+    
+    if index == len(levels) - 1:
+        yield from items
+    else:
+        for item, item_path in items:
+            yield from _iter_nested(item, item_path, levels, index + 1)
 
-    # 构建校验规则
-    rules = []
-    for validation in field_validations:
-        if isinstance(nested_field_value, list):
-            # 嵌套字段值为列表
-            rules.append(f"{list_path}.*.{nested_field}.*.{validation}")
-        elif isinstance(nested_field_value, dict):
-            # 嵌套字段值为字典
-            rules.append(f"{list_path}.*.{nested_field}.{validation}")
+
+"""
+抽样校验 - 超大集合只校验随机抽取的部分元素，给出失败率及其置信上限
+"""
+
+class Sampling:
+    """抽样方式（不可变）
+    
+    :param size: 固定抽取的元素个数
+    :param fraction: 抽取比例（0 < fraction <= 1）
+    :param seed: 随机种子，相同种子在相同数据上抽到相同的元素
+    :param confidence: 失败率置信上限的置信度，默认 0.95
+    
+    size 与 fraction 二选一。列表按下标抽样，不复制列表；
+    不支持下标访问的可迭代对象使用蓄水池抽样（size）或逐个伯努利抽样（fraction），只遍历一次。
+    """
+    __slots__ = ('size', 'fraction', 'seed', 'confidence')
+
+    def __init__(self, size=None, fraction=None, seed=None, confidence=0.95):
+        if (size is None) == (fraction is None):
+            raise ValueError("抽样方式必须指定 size 或 fraction 其中之一")
+        if size is not None and (not isinstance(size, int) or isinstance(size, bool) or size < 1):
+            raise ValueError(f"抽样个数必须是正整数，当前值: {size!r}")
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError(f"抽样比例必须在 (0, 1] 区间内，当前值: {fraction!r}")
+        if not 0 < confidence < 1:
+            raise ValueError(f"置信度必须在 (0, 1) 区间内，当前值: {confidence!r}")
+        _set = object.__setattr__
+        _set(self, 'size', size)
+        _set(self, 'fraction', fraction)
+        _set(self, 'seed', seed)
+        _set(self, 'confidence', confidence)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"抽样方式不可修改: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"抽样方式不可修改: {name}")
+
+    def __repr__(self):
+        amount = f"size={self.size}" if self.size is not None else f"fraction={self.fraction}"
+        return f"Sampling({amount}, seed={self.seed!r}, confidence={self.confidence})"
+
+    def count(self, total):
+        """population 为 total 个元素时应抽取的个数（按比例时向上取整，至少一个）"""
+        if self.size is not None:
+            return min(self.size, total)
+        return min(total, max(1, math.ceil(total * self.fraction)))
+
+    def indexes(self, total, rng):
+        """从 range(total) 中抽取下标，按升序返回"""
+        return sorted(rng.sample(range(total), self.count(total)))
+
+    def select(self, iterable, rng):
+        """从可迭代对象中抽样（只遍历一次），返回 ([(下标, 元素), ...], 元素总数)"""
+        selected = []
+        total = 0
+        if self.size is not None:
+            # 蓄水池抽样：第 i 个元素以 size/(i+1) 的概率替换已选元素
+            for total, item in enumerate(iterable, 1):
+                if total <= self.size:
+                    selected.append((total - 1, item))
+                else:
+                    j = rng.randrange(total)
+                    if j < self.size:
+                        selected[j] = (total - 1, item)
+            selected.sort(key=lambda entry: entry[0])
+        else:
+            for total, item in enumerate(iterable, 1):
+                if rng.random() < self.fraction:
+                    selected.append((total - 1, item))
+        return selected, total
+
+
+SampleCheckResult = namedtuple('SampleCheckResult', ['passed', 'total', 'sampled', 'failed', 'failure_rate', 'upper_bound'])
+
+
+def _normal_quantile(p):
+    """标准正态分布的分位数（二分求解 Φ(z) = p，精度远高于区间计算所需）"""
+    low, high = -10.0, 10.0
+    for _ in range(64):
+        z = (low + high) / 2
+        if 0.5 * (1 + math.erf(z / math.sqrt(2))) < p:
+            low = z
+        else:
+            high = z
+    return (low + high) / 2
+
+
+def _failure_upper_bound(failed, sampled, total, confidence):
+    """失败率的单侧置信上限（Wilson 区间），全部元素都被抽中时即为实际失败率"""
+    if not sampled:
+        return 1.0
+    rate = failed / sampled
+    if sampled >= total:
+        return rate
+    z = _normal_quantile(confidence)
+    z2 = z * z
+    center = rate + z2 / (2 * sampled)
+    margin = z * math.sqrt(rate * (1 - rate) / sampled + z2 / (4 * sampled * sampled))
+    return min(1.0, (center + margin) / (1 + z2 / sampled))
+
+
+def _sample_result(sampling, total, sampled, failed):
+    """汇总抽样结果并输出日志"""
+    rate = failed / sampled if sampled else 0.0
+    upper_bound = _failure_upper_bound(failed, sampled, total, sampling.confidence)
+    result = SampleCheckResult(not failed, total, sampled, failed, rate, upper_bound)
+    log = log_warning if failed else log_info
+    log("抽样校验完成: 抽样 %d/%d, 失败 %d, 失败率 %.2f%%, 置信度 %.0f%% 上限 %.2f%%",
+        sampled, total, failed, rate * 100, sampling.confidence * 100, upper_bound * 100)
+    return result
+
+
+def check_sampled(data, sampling, *validations, quiet=False):
+    """
+    抽样校验 - 通配符展开的集合只校验随机抽取的元素
+    
+    :param data: 要校验的数据
+    :param sampling: Sampling 抽样方式
+    :param validations: 校验规则，与 check() 相同
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志
+    :return: SampleCheckResult(passed, total, sampled, failed, failure_rate, upper_bound)
+             total 为可抽样的元素总数，sampled 为实际校验的元素数，failed 为其中失败的元素数，
+             failure_rate 为观测失败率，upper_bound 为按置信度计算的失败率上限
+    :raises: Exception: 当参数错误或数据结构异常时抛出异常
+    
+    示例：
+    result = check_sampled(export, Sampling(size=1000, seed=42), "rows.*.id > 0", "rows.*.sku")
+    if result.upper_bound > 0.01:
+        ...
+    
+    注意：
+    1. 每个规则在其第一个通配符（或切片）展开的集合上抽样，被抽中元素的剩余路径完整校验
+    2. 相同种子下，展开同一集合的规则抽到相同的元素
+    3. 不含通配符的规则完整校验，各计为一个元素
+    4. 抽中的元素全部校验完才汇总结果，不会在第一个失败时停止，同一规则的失败汇总为一条日志
+    """
+    if quiet:
+        with silent():
+            return check_sampled(data, sampling, *validations)
+    rules = _compile_validations(validations)
+    log_info("抽样校验 - 共%d个校验规则, 抽样方式: %r", len(rules), sampling)
+    
+    debug = is_enabled_for("debug")
+    failures = _FailureSummary()
+    total = sampled = failed = 0
+    for i, rule in enumerate(rules):
+        try:
+            rule_total, rule_sampled, rule_failed = _sample_rule(data, rule, sampling, debug, failures)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            # 数据结构异常，抛出异常
+            error_msg = f"数据结构异常: {rule} - {str(e)}"
+            log_error(f"[{i+1}/{len(rules)}] ❌ {error_msg}")
+            raise Exception(error_msg)
+        failures.emit()
+        if rule_failed:
+            log_warning("[%d/%d] 抽样校验失败: %s - %d/%d 个元素失败 ✗", i + 1, len(rules), rule, rule_failed, rule_sampled)
+        total += rule_total
+        sampled += rule_sampled
+        failed += rule_failed
+    return _sample_result(sampling, total, sampled, failed)
+
+
+def _sample_rule(data, rule, sampling, debug, failures):
+    """在规则第一个展开段的集合上抽样校验，返回 (元素总数, 抽样数, 失败数)"""
+    segments = rule.path.segments
+    expansion = next((i for i, segment in enumerate(segments) if _expands(segment)), None)
+    if expansion is None:
+        return 1, 1, 0 if _validate_field_path(data, rule) else 1
+    
+    names = [segment[0] for segment in segments]
+    collection, path = _compile_path(".".join(names[:expansion])).resolve(data)
+    segment = segments[expansion]
+    element_rule = _Rule(None, ".".join(names[expansion + 1:]), rule.validator, rule.expect, rule.func)
+    
+    # 列表按下标抽样；切片在其下标范围内抽样；字典按键抽样
+    if segment is _WILDCARD:
+        if isinstance(collection, list):
+            positions = range(len(collection))
+        elif isinstance(collection, dict):
+            positions = list(collection)
         else:
-            raise ValueError(f"嵌套字段 {nested_field} 的值不是列表或字典")
+            raise TypeError(f"通配符'*'只能用于列表或字典，路径: {_format_path(path)}, 类型: {type(collection)}")
+    elif isinstance(collection, list):
+        positions = range(*segment[1].indices(len(collection)))
+    elif isinstance(collection, dict):
+        # 切片形式的字典键（如 10:30）只有一个元素
+        _get_child(collection, path, segment)
+        positions = [segment[0]]
+    else:
+        raise TypeError(f"切片'{segment[0]}'只能用于列表，路径: {_format_path(path)}, 类型: {type(collection)}")
+    
+    rng = random.Random(sampling.seed)
+    failed = 0
+    chosen = sampling.indexes(len(positions), rng)
+    for i in chosen:
+        key = positions[i]
+        element_path = (path, key)
+        for value, value_path in element_rule.path.iter_values(collection[key], element_path):
+            if not _check_value(element_rule, value, value_path, debug, failures):
+                failed += 1
+                break
+    return len(positions), len(chosen), failed
+
+
+def check_list_sampled(data_list, sampling, *field_names, quiet=False, **validators):
+    """
+    列表数据抽样校验 - 参数与 check_list() 相同，只校验随机抽取的行
+    
+    :param data_list: 数据列表，也可以是只能遍历一次的可迭代对象（如生成器、文件逐行解析结果）
+    :param sampling: Sampling 抽样方式
+    :param quiet: 静默模式，为 True 时本次调用不输出任何日志（名为 quiet 的字段请使用 "quiet ..." 字符串规则）
+    :return: SampleCheckResult(passed, total, sampled, failed, failure_rate, upper_bound)
+    :raises: Exception: 当参数错误或数据结构异常时抛出异常
+    
+    示例：
+    # 固定抽取1000行，结果可复现
+    check_list_sampled(rows, Sampling(size=1000, seed=7), "id > 0", "sku")
+    
+    # 按比例抽样，适用于不知道总行数的迭代器
+    check_list_sampled(iter_rows(path), Sampling(fraction=0.01, seed=7), price="> 0")
+    """
+    if quiet:
+        with silent():
+            return check_list_sampled(data_list, sampling, *field_names, **validators)
+    rules = _list_rules(field_names, validators)
+    log_info("列表数据抽样校验 - 字段数: %d, 抽样方式: %r", len(rules), sampling)
+    
+    rng = random.Random(sampling.seed)
+    if isinstance(data_list, (list, tuple)):
+        total = len(data_list)
+        rows = ((i, data_list[i]) for i in sampling.indexes(total, rng))
+    else:
+        try:
+            iterator = iter(data_list)
+        except TypeError:
+            raise TypeError(f"data_list必须是列表或可迭代对象，当前类型: {type(data_list)}")
+        rows, total = sampling.select(iterator, rng)
+    
+    debug = is_enabled_for("debug")
+    failures = _FailureSummary()
+    sampled = failed = 0
+    for row_index, row in rows:
+        sampled += 1
+        if not _check_row(rules, row, row_index, debug, failures):
+            failed += 1
+    failures.emit()
+    return _sample_result(sampling, total, sampled, failed)
+
 
-    return check(data, *rules)
+# 未绑定数据的标记（None 本身是合法的待校验数据）
+_NO_DATA = object()
 
 
 class DataChecker:
-    """链式调用的数据校验器"""
+    """链式调用的数据校验器
+    
+    可以不绑定数据构建规则链，通过 freeze() 得到可重复使用的预编译规则集合：
+    schema = checker().not_empty("data.id").greater_than("data.price", 0).freeze()
+    schema.validate(response)
+    """
     
-    def __init__(self, data):
+    def __init__(self, data=_NO_DATA):
         self.data = data
         self.rules = []
     
     def field(self, path, validator=None, expect=None):
-        """添加字段校验"""
+        """添加字段校验
+        
+        :param validator: 省略时为非空校验；仅传入时为字符串表达式（如 "> 0"）；
+                          与 expect 同时传入时为操作符（如 ">"、"in"）或校验器名称（如 "gt"）
+        :param expect: 期望值；字符串按规则字面量解析（如 "3" 为整数、"'ab'" 为字符串 ab、"null" 为 None），
+                       其他类型按原值使用
+        """
         if validator is None:
             # 默认非空
-            self.rules.append(path)
+            return self._add_rule(path, 'not_empty', True)
         elif expect is None:
             # 字符串表达式
             self.rules.append(f"{path} {validator}")
-        else:
-            # 分离的校验器和期望值
-            self.rules.append(f"{path} {validator} {expect}")
-        return self
+            return self
+        
+        # 分离的校验器和期望值
+        op = validator.strip()
+        if op in _KEYWORD_OPERATORS or (isinstance(expect, str) and op in _OPERATORS):
+            # 与字符串表达式相同的解析（列表、区间、带引号的字面量等）
+            self.rules.append(f"{path} {op} {expect}")
+            return self
+        if isinstance(expect, str):
+            expect = _parse_expect_value(expect)
+        return self._add_rule(path, _OPERATORS.get(op, op), expect)
     
     def not_empty(self, *paths):
         """批量非空校验"""
-        self.rules.extend(paths)
+        for path in paths:
+            self._add_rule(path, 'not_empty', True)
+        return self
+    
+    def _add_rule(self, path, validator, expect):
+        """直接追加预编译规则，期望值按原值使用，不再经过规则字符串的格式化和解析"""
+        try:
+            rule = _Rule(None, path, validator, expect)
+        except ValueError:
+            # 规则错误与其他格式一致，在 validate() 时以数据结构异常抛出
+            rule = {'field': path, 'validator': validator, 'expect': expect}
+        self.rules.append(rule)
         return self
     
     # 等值比较校验
     def equals(self, path, value):
         """等于校验"""
-        self.rules.append(f"{path} == {repr(value)}")
-        return self
+        return self._add_rule(path, 'eq', value)
     
     def not_equals(self, path, value):
         """不等于校验"""
-        self.rules.append(f"{path} != {repr(value)}")
-        return self
+        return self._add_rule(path, 'ne', value)
     
     # 数值比较校验
     def greater_than(self, path, value):
         """大于校验"""
-        self.rules.append(f"{path} > {value}")
-        return self
+        return self._add_rule(path, 'gt', value)
     
     def greater_equal(self, path, value):
         """大于等于校验"""
-        self.rules.append(f"{path} >= {value}")
-        return self
+        return self._add_rule(path, 'ge', value)
     
     def less_than(self, path, value):
         """小于校验"""
-        self.rules.append(f"{path} < {value}")
-        return self
+        return self._add_rule(path, 'lt', value)
     
     def less_equal(self, path, value):
         """小于等于校验"""
-        self.rules.append(f"{path} <= {value}")
-        return self
+        return self._add_rule(path, 'le', value)
     
     # 数值范围校验
     def between(self, path, min_value, max_value, inclusive=True):
-        """数值区间校验"""
-        if inclusive:
-            self.rules.append(f"{path} >= {min_value}")
-            self.rules.append(f"{path} <= {max_value}")
-        else:
-            self.rules.append(f"{path} > {min_value}")
-            self.rules.append(f"{path} < {max_value}")
-        return self
+        """数值区间校验（单条规则，一次遍历同时校验上下限）"""
+        return self._add_rule(path, 'range', (min_value, max_value, inclusive))
     
     # 字符串校验
     def starts_with(self, path, prefix):
         """以指定字符串开头"""
-        self.rules.append(f"{path} ^= {repr(prefix)}")
-        return self
+        return self._add_rule(path, 'startswith', prefix)
     
     def ends_with(self, path, suffix):
         """以指定字符串结尾"""
-        self.rules.append(f"{path} $= {repr(suffix)}")
-        return self
+        return self._add_rule(path, 'endswith', suffix)
     
     def contains(self, path, substring):
         """包含指定字符串"""
-        self.rules.append(f"{path} *= {repr(substring)}")
-        return self
+        return self._add_rule(path, 'contains', substring)
     
     def contained_by(self, path, container):
         """被指定字符串包含"""
-        self.rules.append(f"{path} =* {repr(container)}")
-        return self
+        return self._add_rule(path, 'contained_by', container)
     
-    def matches_regex(self, path, pattern):
-        """正则表达式匹配"""
-        self.rules.append(f"{path} ~= {repr(pattern)}")
-        return self
+    def matches_regex(self, path, pattern, mode="match"):
+        """正则表达式匹配
+        
+        :param pattern: 正则表达式字符串或已编译的正则对象
+        :param mode: 匹配方式 - match（从开头匹配，默认）、fullmatch（完整匹配）、search（任意位置匹配）
+        """
+        validators = {"match": "regex", "fullmatch": "regex_fullmatch", "search": "regex_search"}
+        if mode not in validators:
+            raise ValueError(f"不支持的正则匹配方式: {mode}，可选值: match、fullmatch、search")
+        return self._add_rule(path, validators[mode], pattern)
     
     # 类型校验
     def is_type(self, path, expected_type):
-        """类型校验"""
-        if isinstance(expected_type, type):
-            type_name = expected_type.__name__
-        else:
-            type_name = str(expected_type)
-        self.rules.append(f"{path} @= {repr(type_name)}")
-        return self
+        """类型校验
+        
+        :param expected_type: 类型对象、类型元组或类型名称字符串（如 'int'、'number'）
+        """
+        return self._add_rule(path, 'type_match', expected_type)
     
     def is_string(self, path):
         """字符串类型校验"""
         return self.is_type(path, 'str')
     
     def is_number(self, path):
-        """数字类型校验（int或float）"""
-        # 使用自定义校验逻辑
-        self.rules.append({
-            'field': path,
-            'validator': 'custom_number_check',
-            'expect': None
-        })
-        return self
+        """数字类型校验（int或float，不包括bool）"""
+        return self.is_type(path, 'number')
     
     def is_integer(self, path):
-        """整数类型校验"""
+        """整数类型校验（不包括bool）"""
         return self.is_type(path, 'int')
     
     def is_float(self, path):
@@ -738,135 +2138,56 @@ class DataChecker:
     # 集合校验
     def in_values(self, path, values):
         """值在指定集合中"""
-        # 使用自定义校验逻辑
-        self.rules.append({
-            'field': path,
-            'validator': 'in_values',
-            'expect': values
-        })
-        return self
+        return self._add_rule(path, 'in_values', values)
     
     def not_in_values(self, path, values):
         """值不在指定集合中"""
-        # 使用自定义校验逻辑
-        self.rules.append({
-            'field': path,
-            'validator': 'not_in_values',
-            'expect': values
-        })
-        return self
+        return self._add_rule(path, 'not_in_values', values)
     
     # 长度校验
     def length_equals(self, path, length):
         """长度等于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_eq',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_eq', length)
     
     def length_not_equals(self, path, length):
         """长度不等于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_ne',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_ne', length)
     
     def length_greater_than(self, path, length):
         """长度大于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_gt',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_gt', length)
     
     def length_less_than(self, path, length):
         """长度小于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_lt',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_lt', length)
 
     def length_greater_equal(self, path, length):
         """长度大于等于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_ge',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_ge', length)
     
     def length_less_equal(self, path, length):
         """长度小于等于指定值"""
-        self.rules.append({
-            'field': path,
-            'validator': 'length_le',
-            'expect': length
-        })
-        return self
+        return self._add_rule(path, 'length_le', length)
 
     def length_between(self, path, min_length, max_length, inclusive=True):
-        """长度在指定范围内"""
-        if inclusive:
-            self.rules.append({
-                'field': path,
-                'validator': 'length_ge',
-                'expect': min_length
-            })
-            self.rules.append({
-                'field': path,
-                'validator': 'length_le',
-                'expect': max_length
-            })
-        else:
-            self.rules.append({
-                'field': path,
-                'validator': 'length_gt',
-                'expect': min_length
-            })
-            self.rules.append({
-                'field': path,
-                'validator': 'length_lt',
-                'expect': max_length
-            })
-        return self
+        """长度在指定范围内（单条规则，一次遍历同时校验上下限）"""
+        return self._add_rule(path, 'length_range', (min_length, max_length, inclusive))
     
     # 特殊校验
     def is_email(self, path):
         """邮箱格式校验"""
         email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        self.rules.append({
-            'field': path,
-            'validator': 'regex',
-            'expect': email_pattern
-        })
-        return self
+        return self._add_rule(path, 'regex', email_pattern)
     
     def is_phone(self, path):
         """手机号格式校验（中国大陆）"""
         phone_pattern = r'^1[3-9]\d{9}$'
-        self.rules.append({
-            'field': path,
-            'validator': 'regex',
-            'expect': phone_pattern
-        })
-        return self
+        return self._add_rule(path, 'regex', phone_pattern)
     
     def is_url(self, path):
         """URL格式校验"""
         url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        self.rules.append({
-            'field': path,
-            'validator': 'regex',
-            'expect': url_pattern
-        })
-        return self
+        return self._add_rule(path, 'regex', url_pattern)
     
     def is_positive(self, path):
         """正数校验"""
@@ -897,6 +2218,41 @@ class DataChecker:
             self.is_type(path, field_type)
         return self
     
+    # 量词校验
+    def any_match(self, path, rule=None):
+        """至少一个元素满足规则
+        
+        :param path: 列表或字典的路径
+        :param rule: 相对于元素的规则字符串（如 "is_default == true"），省略时为元素非空
+        
+        示例：
+        .any_match("payments", "is_default == true")
+        """
+        return self._add_quantified(path, '*any', rule)
+    
+    def none_match(self, path, rule=None):
+        """没有元素满足规则，如 .none_match("lines", "qty == 0")"""
+        return self._add_quantified(path, '*none', rule)
+    
+    def at_least(self, count, path, rule=None):
+        """至少 count 个元素满足规则，如 .at_least(3, "images")"""
+        return self._add_quantified(path, f'*{count}+', rule)
+    
+    def exactly(self, count, path, rule=None):
+        """恰好 count 个元素满足规则，如 .exactly(1, "payments", "is_default == true")"""
+        return self._add_quantified(path, f'*{count}', rule)
+    
+    def _add_quantified(self, path, quantifier, rule):
+        """将元素规则挂到集合路径的量词通配符之后"""
+        if rule is None:
+            return self._add_rule(f"{path}.{quantifier}", 'not_empty', True)
+        element_rule = _parse_cached(rule)
+        # 元素规则省略路径时（如 "== 1"）直接作用于元素本身
+        field_path = f"{path}.{quantifier}"
+        if element_rule.field_path:
+            field_path = f"{field_path}.{element_rule.field_path}"
+        return self._add_rule(field_path, element_rule.validator, element_rule.expect)
+    
     # 条件校验
     def when(self, condition, *then):
         """
@@ -920,7 +2276,7 @@ class DataChecker:
               "description",
               "category != 'test'")
         
-        # 支持通配符 - 当所有产品状态为active时，价格都必须大于0且名称不能为空
+        # 按元素校验 - 每个状态为active的产品，其价格必须大于0且名称不能为空
         .when("products.*.status == 'active'", 
               "products.*.price > 0", 
               "products.*.name")
@@ -938,7 +2294,8 @@ class DataChecker:
         注意：
         1. 当条件满足时，所有then校验都必须通过才算成功
         2. 当条件不满足时，跳过所有then校验（返回True）
-        3. 支持链式调用，可以添加多个条件校验
+        3. 条件和then规则共享通配符前缀（如 products.*）时按元素绑定，每个元素分别判断条件
+        4. 支持链式调用，可以添加多个条件校验
         """
         
         # 参数验证
@@ -956,17 +2313,34 @@ class DataChecker:
         })
         return self
     
-    def validate(self):
+    def validate(self, *plans, quiet=False):
         """执行校验
         
+        :param plans: 可选，额外的预编译规则集合（compile_rules() 的结果），与链式规则一并校验
+        :param quiet: 静默模式，为 True 时本次校验不输出任何日志
         :return: True表示所有校验通过，False表示存在校验失败
         :raises: Exception: 当参数错误或数据结构异常时抛出异常
         
         注意：日志输出级别可通过项目的 --log-level 参数控制
         """
-        return check(self.data, *self.rules)
+        if self.data is _NO_DATA:
+            raise ValueError("校验器未绑定数据，请使用 checker(data)，或通过 freeze() 生成规则集合后调用 validate(data)")
+        return check(self.data, *self.rules, *plans, quiet=quiet)
+    
+    def freeze(self):
+        """将当前规则链编译为与数据无关的预编译规则集合
+        
+        :return: RulePlan 不可变、线程安全的规则集合，可通过 plan.validate(data) 重复校验
+        :raises: ValueError: 当规则格式错误时抛出异常
+        
+        示例：
+        schema = checker().not_empty("data.id").greater_than("data.price", 0).freeze()
+        for response in responses:
+            schema.validate(response)
+        """
+        return compile_rules(*self.rules)
 
 
-def checker(data):
-    """创建数据校验器"""
+def checker(data=_NO_DATA):
+    """创建数据校验器，省略 data 时可用于构建可复用的规则集合（见 DataChecker.freeze）"""
     return DataChecker(data)
\ No newline at end of file
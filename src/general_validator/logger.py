@@ -1,6 +1,12 @@
+import atexit
+import copy
 import logging
 import os
+import queue
 import sys
+import threading
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from colorama import Fore, init
 from colorlog import ColoredFormatter
@@ -9,6 +15,8 @@ init(autoreset=True)
 
 LOG_LEVEL = "INFO"
 LOG_FILE_PATH = ""
+# 大于 0 时日志经有界队列交给后台线程写出，校验线程不再阻塞在 I/O 上
+LOG_QUEUE_SIZE = 0
 
 log_colors_config = {
     "DEBUG": "cyan",
@@ -18,28 +26,55 @@ log_colors_config = {
     "CRITICAL": "red",
 }
 loggers = {}
+# 由 get_logger 添加的 handler（按 logger 名称），重新配置时替换；外部已配置的 logger 保持原样
+_owned_handlers = {}
+# 当前配置下日志函数使用的 logger，setup_logger 修改配置时失效
+_active_logger = None
+# 全局静默开关，以及仅对当前线程内的调用生效的静默标记
+SILENT = False
 
 
-def setup_logger(log_level, log_file=None):
-    global LOG_LEVEL
+class _SilentScope(threading.local):
+    silent = False
+
+
+_silent_scope = _SilentScope()
+
+
+def setup_logger(log_level, log_file=None, queue_size=None):
+    """设置日志级别和日志文件
+
+    :param queue_size: 大于 0 时启用非阻塞日志：日志先放入容量为 queue_size 的队列，
+                       由后台线程写出，队列已满时丢弃并计数（见 dropped_log_count()）；
+                       为 0 时同步写出；省略时保持当前设置
+    """
+    global LOG_LEVEL, LOG_FILE_PATH, LOG_QUEUE_SIZE, _active_logger
+    log_file = log_file or LOG_FILE_PATH
+    queue_size = LOG_QUEUE_SIZE if queue_size is None else queue_size
+    if (log_level, log_file, queue_size) == (LOG_LEVEL, LOG_FILE_PATH, LOG_QUEUE_SIZE):
+        return
+
     LOG_LEVEL = log_level
+    LOG_FILE_PATH = log_file
+    LOG_QUEUE_SIZE = queue_size
 
-    if log_file:
-        global LOG_FILE_PATH
-        LOG_FILE_PATH = log_file
+    # 配置已变更：之前解析的 logger 全部失效，下次使用时按新配置重新设置
+    loggers.clear()
+    _active_logger = None
 
 
 def get_logger(name=None):
     """setup logger with ColoredFormatter."""
     name = name or "httprunner"
-    logger_key = "".join([name, LOG_LEVEL, LOG_FILE_PATH])
+    logger_key = "".join([name, LOG_LEVEL, LOG_FILE_PATH, str(LOG_QUEUE_SIZE)])
     if logger_key in loggers:
         return loggers[logger_key]
 
     _logger = logging.getLogger(name)
 
-    # 检查是否已经有handler，避免重复添加
-    if _logger.handlers:
+    # 检查是否已经有外部添加的handler，避免重复添加
+    owned = _owned_handlers.get(name)
+    if _logger.handlers and owned is None:
         loggers[logger_key] = _logger
         return _logger
 
@@ -62,19 +97,142 @@ def get_logger(name=None):
     else:
         handler = logging.StreamHandler(sys.stdout)
 
+    # 消息按级别着色由格式化器完成，日志函数无需为每条消息拼接颜色前缀
     formatter = ColoredFormatter(
-        "%(log_color)s%(bg_white)s%(levelname)-8s%(reset)s %(message)s",
+        "%(log_color)s%(bg_white)s%(levelname)-8s%(reset)s %(log_color)s%(message)s",
         datefmt=None,
         reset=True,
         log_colors=log_colors_config,
     )
     handler.setFormatter(formatter)
+    if LOG_QUEUE_SIZE > 0:
+        handler = _DroppingQueueHandler(LOG_QUEUE_SIZE, handler)
+    if owned is not None:
+        # 配置已变更：替换之前添加的handler
+        _logger.removeHandler(owned)
+        owned.close()
     _logger.addHandler(handler)
+    _owned_handlers[name] = handler
 
     loggers[logger_key] = _logger
     return _logger
 
 
+class _FlushingQueueListener(QueueListener):
+    """停止时阻塞等待结束标记入队，队列已满也能写完剩余日志后退出"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """非阻塞日志 handler：日志放入有界队列后立即返回，由后台线程交给实际的 handler 写出
+
+    队列已满时丢弃日志并计数，校验线程的耗时不受日志输出端（慢管道、网络文件系统等）影响。
+    """
+
+    def __init__(self, maxsize, target):
+        super().__init__(queue.Queue(maxsize))
+        self.target = target
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+        self.listener = _FlushingQueueListener(self.queue, target)
+        self.listener.start()
+        _queue_handlers.add(self)
+
+    def prepare(self, record):
+        # 只在当前线程合并消息参数，着色等格式化由后台线程完成；
+        # 修改副本，向上传递给其他 handler 的原记录保留参数和异常信息
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.msg = message
+        if record.exc_info:
+            record.msg = "%s\n%s" % (record.msg, logging.Formatter().formatException(record.exc_info))
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+    def flush(self):
+        """等待队列中的日志全部写出"""
+        self.queue.join()
+        self.target.flush()
+
+    def close(self):
+        if self in _queue_handlers:
+            _queue_handlers.discard(self)
+            self.listener.stop()
+            self.target.close()
+        super().close()
+
+
+# 运行中的非阻塞日志 handler，进程退出时写完队列中剩余的日志
+_queue_handlers = set()
+
+
+@atexit.register
+def _stop_queue_handlers():
+    for handler in list(_queue_handlers):
+        handler.close()
+
+
+def dropped_log_count():
+    """非阻塞日志模式下因队列已满而丢弃的日志条数（未启用时为 0）"""
+    handler = _owned_handlers.get(_current_logger().name)
+    return getattr(handler, "dropped", 0)
+
+
+def flush_logs():
+    """等待非阻塞日志队列中的日志全部写出（同步模式下直接刷新输出）"""
+    for handler in _current_logger().handlers:
+        handler.flush()
+
+
+def _current_logger():
+    """返回当前配置下的 logger，只在首次使用或 setup_logger 修改配置后解析一次"""
+    global _active_logger
+    _logger = _active_logger
+    if _logger is None:
+        _logger = _active_logger = get_logger()
+    return _logger
+
+
+def set_silent(enabled=True):
+    """全局静默模式：开启后所有日志函数直接返回，不调用 logger，也不格式化任何消息"""
+    global SILENT
+    SILENT = enabled
+
+
+@contextmanager
+def silent():
+    """在 with 语句块内静默日志，只影响当前线程，用于单次调用的 quiet 参数"""
+    previous = _silent_scope.silent
+    _silent_scope.silent = True
+    try:
+        yield
+    finally:
+        _silent_scope.silent = previous
+
+
+def is_silent():
+    """判断当前是否处于静默模式（全局或当前调用）"""
+    return SILENT or _silent_scope.silent
+
+
+def is_enabled_for(level):
+    """判断指定级别的日志当前是否会输出，用于跳过不会输出的日志消息的构建"""
+    if SILENT or _silent_scope.silent:
+        return False
+    return _current_logger().isEnabledFor(getattr(logging, level.upper()))
+
+
 def coloring(text, color="WHITE"):
     fore_color = getattr(Fore, color.upper())
     return fore_color + text
@@ -86,12 +244,19 @@ def color_print(msg, color="WHITE"):
 
 
 def log_with_color(level):
-    """log with color by different level"""
+    """log with color by different level
+
+    支持 %-style 延迟格式化参数，如 log_debug("共校验 %d 个值", count)：
+    级别未开启或处于静默模式时直接返回，不格式化参数。消息颜色由格式化器按级别添加。
+    """
+    level_no = getattr(logging, level.upper())
 
-    def wrapper(text):
-        color = log_colors_config[level.upper()]
-        _logger = get_logger()
-        getattr(_logger, level.lower())(coloring(text, color))
+    def wrapper(text, *args):
+        if SILENT or _silent_scope.silent:
+            return
+        _logger = _active_logger or _current_logger()
+        if _logger.isEnabledFor(level_no):
+            _logger.log(level_no, text, *args)
 
     return wrapper
 
@@ -8,7 +8,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from general_validator.checker import check_list, check, checker
+from general_validator.checker import check_list, check_list_rows, check, checker, compile_rules
 
 # 测试数据
 test_products = [
@@ -101,6 +101,35 @@ def test_complex_validations():
     print(f"复杂组合校验结果: {result}")
 
 
+def test_row_results():
+    """测试逐行校验结果"""
+    print("\n=== 测试逐行校验结果 ===")
+    
+    result = check_list_rows(test_products, "id > 0", "name", status="== 'active'")
+    print(f"逐行校验结果: {result}")
+    assert result.passed == False
+    assert result.failed_rows == (2,)
+    assert result.row_results == (True, True, False)
+    
+    # 失败行之后的行仍然校验
+    rows = [{"id": 0}, {"id": 1}, {"id": -1}, {"id": 2}]
+    result = check_list_rows(rows, "id > 0")
+    assert result.failed_rows == (0, 2) and result.row_results == (False, True, False, True)
+    assert check_list(rows, "id > 0") == False
+    
+    # 预编译规则与字典格式规则
+    result = check_list_rows(test_products, compile_rules("price > 60"), {"field": "tags", "validator": "length_ge", "expect": 2})
+    assert result.failed_rows == (2,)
+    assert check_list_rows([], "id").passed == True
+    
+    # 数据结构异常仍然抛出
+    try:
+        check_list_rows(rows + [{"name": "x"}], "id")
+        assert False, "应该抛出异常"
+    except Exception as e:
+        print(f"数据结构异常: {e}")
+
+
 def test_style_comparison():
     """测试与其他函数风格的对比"""
     print("\n=== 测试与其他函数风格的对比 ===")
@@ -196,6 +225,7 @@ if __name__ == "__main__":
     test_basic_usage()
     test_various_validators()
     test_complex_validations()
+    test_row_results()
     test_wildcard_handling()
     test_style_comparison()
     test_consistency_with_check()
@@ -123,6 +123,18 @@ def test_specialized_functions():
                    price="> 0", id="> 0")           # 带校验器
         print("✓ 列表批量校验通过")
         
+        # 遇到第一个失败的行即停止：之后缺少字段的行不再访问，返回 False 而不是抛出异常
+        rows = [{"id": 1}, {"id": 0}, {}]
+        assert check_list(rows, "id > 0") == False
+        try:
+            # 缺少字段的行在第一个失败之前时仍然抛出数据结构异常
+            check_list([rows[0], rows[2], rows[1]], "id > 0")
+            raise AssertionError("结构异常未抛出")
+        except AssertionError:
+            raise
+        except Exception as e:
+            assert "数据结构异常" in str(e)
+        
         # 3. 链式调用
         print("3. 测试链式调用...")
         checker(response)\
@@ -139,6 +151,51 @@ def test_specialized_functions():
     return True
 
 
+def test_nested_validation():
+    """测试嵌套列表校验：逐元素判断形态、多级嵌套"""
+    print("\n=== 测试嵌套列表校验 ===")
+    
+    data = {
+        "orders": [
+            {"lines": [{"allocations": [{"warehouse": "A", "qty": 1}, {"warehouse": "B", "qty": 2}]}]},
+            {"lines": [{"allocations": {"warehouse": "C", "qty": 3}}]}
+        ],
+        "plans": [
+            {"plan": [{"id": 1}, {"id": 2}]},
+            {"plan": {"id": 3}}
+        ]
+    }
+    
+    try:
+        # 1. 同一列表中嵌套字段既有列表又有字典
+        assert check_nested(data, "plans", "plan", "id > 0")
+        assert not check_nested(data, "plans", "plan", "id > 2")
+        
+        # 2. 多级嵌套
+        assert check_nested(data, "orders", "lines.allocations", "warehouse", "qty > 0")
+        assert not check_nested(data, "orders", "lines.allocations", "qty < 3")
+        
+        # 3. 空的主列表
+        assert check_nested({"orders": []}, "orders", "lines", "id")
+        
+        # 4. 结构异常
+        for bad in ({"orders": {}}, {"orders": [{"lines": 1}]}, {"orders": [{}]}):
+            try:
+                check_nested(bad, "orders", "lines", "id")
+                assert False, "结构异常未抛出"
+            except Exception as e:
+                assert "结构异常未抛出" not in str(e)
+        
+        # 5. 遇到第一个失败即停止：之后缺少字段的元素不再访问，返回 False 而不是抛出异常
+        assert check_nested({"orders": [{"lines": [{"id": 0}]}, {}]}, "orders", "lines", "id > 0") == False
+        print("✓ 嵌套列表校验通过")
+    except Exception as e:
+        print(f"✗ 嵌套列表校验失败: {e}")
+        return False
+    
+    return True
+
+
 def test_error_handling():
     """测试错误处理"""
     print("\n=== 测试错误处理 ===")
@@ -237,6 +294,7 @@ def main():
     tests = [
         test_basic_validation,
         test_specialized_functions,
+        test_nested_validation,
         test_error_handling,
         test_data_types
     ]
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+性能基准测试 - 对比关键路径优化前后的耗时
+
+运行方式：python tests/性能基准测试.py
+各项基准同时作为测试函数，断言优化后的实现不慢于优化前的实现。
+"""
+
+import sys
+import os
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from general_validator.logger import setup_logger, log_debug
+import general_validator.checker as checker_module
+from general_validator.checker import _tokenize_rule, _format_path, _validate_field_path, compile_rules, check, check_list
+
+
+def _best_of(legacy, current, number, repeat=5):
+    """两种实现交替重复计时，各取最优耗时（秒），避免机器负载变化只影响其中一方"""
+    legacy_times, current_times = [], []
+    for _ in range(repeat):
+        legacy_times.append(timeit.timeit(legacy, number=number))
+        current_times.append(timeit.timeit(current, number=number))
+    return min(legacy_times), min(current_times)
+
+
+def _report(title, legacy_time, current_time):
+    print(f"{title}: 优化前 {legacy_time * 1000:.2f}ms, 优化后 {current_time * 1000:.2f}ms, "
+          f"提升 {legacy_time / current_time:.2f}x")
+
+
+# 优化前的规则切分实现：逐个操作符做子串查找和切分
+_LEGACY_OPERATORS = [
+    ("#<=", "length_le"), ("#>=", "length_ge"), ("#!=", "length_ne"), ("#=", "length_eq"), ("#<", "length_lt"), ("#>", "length_gt"), ("!=", "ne"),
+    ("==", "eq"), ("<=", "le"), (">=", "ge"), ("<", "lt"), (">", "gt"),
+    ("~=", "regex"), ("^=", "startswith"), ("$=", "endswith"), ("*=", "contains"), ("=*", "contained_by"),
+    ("@=", "type_match")
+]
+
+
+def _legacy_tokenize_rule(rule):
+    for op, validator in _LEGACY_OPERATORS:
+        if op in rule:
+            parts = rule.split(op, 1)
+            if len(parts) == 2:
+                return parts[0].strip(), validator, parts[1].strip()
+    return rule.strip(), None, None
+
+
+BENCH_RULES = [
+    "status_code == 200",
+    "data.product.id > 0",
+    "data.product.name",
+    "data.productList.*.price >= 10.5",
+    "data.productList.*.purchasePlan.*.name ^= 'plan'",
+    "data.user.email ~= '^[a-z0-9._%+-]+@[a-z0-9.-]+$'",
+    "data.user.tags #<= 5",
+    "data.user.profile.settings.notifications.email.enabled @= 'bool'",
+    "data.items.*.sku",
+    "response.body.data.list.*.id",
+    "data.user.address.city",
+    "data.user.code > 'a==b'",
+]
+LONG_RULES = ["data." + ".".join(f"level{i}" for i in range(20)) + ".value >= 10"]
+
+
+def test_rule_tokenize_benchmark():
+    """规则切分：单次扫描 vs 逐操作符子串查找"""
+    print("\n=== 规则切分性能 ===")
+    # 优化前会在期望值中的 '==' 处错误切分
+    assert _tokenize_rule(BENCH_RULES[-1]) == ("data.user.code", "gt", "'a==b'")
+    # 紧凑写法中路径末尾的通配符不能与 '==' 组成 '*='
+    assert _tokenize_rule("list.*==1") == ("list.*", "eq", "1")
+    assert check({"list": [1, 1]}, "list.*==1")
+    for rule in BENCH_RULES[:-1] + LONG_RULES:
+        assert _tokenize_rule(rule) == _legacy_tokenize_rule(rule)
+
+    for title, rules in (("常规规则", BENCH_RULES), ("长路径规则", LONG_RULES)):
+        def legacy():
+            for rule in rules:
+                _legacy_tokenize_rule(rule)
+
+        def current():
+            for rule in rules:
+                _tokenize_rule(rule)
+
+        legacy_time, current_time = _best_of(legacy, current, 20000, repeat=9)
+        _report(f"规则切分（{title}）", legacy_time, current_time)
+        # 常规规则的改动是为了解析正确性，耗时与原实现相当，只输出对比结果；长路径规则只扫描一遍，断言更快
+        if rules is LONG_RULES:
+            assert current_time < legacy_time
+
+
+# 优化前的路径取值实现：每一层都构建完整的 (值, 路径) 列表
+def _legacy_get_values_by_path(obj, parts):
+    current_objects = [(obj, "")]
+    for part in parts:
+        next_objects = []
+        for current_obj, current_path in current_objects:
+            if part == '*':
+                for i, item in enumerate(current_obj):
+                    next_objects.append((item, f"{current_path}[{i}]" if current_path else f"[{i}]"))
+            else:
+                next_objects.append((current_obj[part], f"{current_path}.{part}" if current_path else part))
+        current_objects = next_objects
+    return current_objects
+
+
+def test_wildcard_early_exit_benchmark():
+    """通配符取值：流式遍历遇到失败立即停止 vs 先展开全部匹配再校验"""
+    print("\n=== 通配符流式遍历性能 ===")
+    setup_logger("ERROR")
+    data = {"data": {"orders": [{"lines": [{"sku": f"SKU-{i}-{j}"} for j in range(20)]} for i in range(5000)]}}
+    data["data"]["orders"][0]["lines"][3]["sku"] = ""
+    rule = compile_rules("data.orders.*.lines.*.sku").rules[0]
+
+    # 流式遍历与原实现产出相同的结果
+    parts = ("data", "orders", "*", "lines", "*", "sku")
+    streamed = [(value, _format_path(path)) for value, path in rule.path.iter_values(data)]
+    assert streamed == _legacy_get_values_by_path(data, parts)
+
+    def legacy():
+        for value, path in _legacy_get_values_by_path(data, parts):
+            if not rule.func(value):
+                return False
+        return True
+
+    def current():
+        return check(data, rule)
+
+    assert legacy() == current() == False
+    legacy_time, current_time = _best_of(legacy, current, 3, repeat=3)
+    _report("通配符提前退出", legacy_time, current_time)
+    # 提前退出只访问到第一个失败元素，耗时相差数个数量级，留足余量避免计时波动
+    assert current_time * 10 <= legacy_time
+
+    # 全部通过时需要遍历所有元素：路径只保存父节点链，不再为每个元素格式化路径字符串
+    data["data"]["orders"][0]["lines"][3]["sku"] = "SKU-0-3"
+    assert legacy() == current() == True
+    legacy_time, current_time = _best_of(legacy, current, 3, repeat=3)
+    _report("通配符全量遍历", legacy_time, current_time)
+    assert current_time < legacy_time
+
+
+def test_plain_path_benchmark():
+    """无通配符路径：预编译路径直接逐级取值 vs 每次切分路径并构建 (值, 路径) 列表"""
+    print("\n=== 无通配符路径取值性能 ===")
+    data = {"status_code": 200, "data": {"user": {"id": 7, "profile": {"address": {"city": "Hangzhou"}}}}}
+    paths = ["status_code", "data.user.id", "data.user.profile.address.city"]
+    compiled = [compile_rules(path).rules[0].path for path in paths]
+    for path, compiled_path in zip(paths, compiled):
+        assert [value for value, _ in compiled_path.iter_values(data)] == \
+            [value for value, _ in _legacy_get_values_by_path(data, path.split('.'))]
+
+    def legacy():
+        for path in paths:
+            for value, _ in _legacy_get_values_by_path(data, path.split('.')):
+                pass
+
+    def current():
+        for compiled_path in compiled:
+            for value, _ in compiled_path.iter_values(data):
+                pass
+
+    legacy_time, current_time = _best_of(legacy, current, 20000)
+    _report("无通配符路径取值", legacy_time, current_time)
+    assert current_time <= legacy_time
+
+
+def test_shared_prefix_benchmark():
+    """共享前缀的多条规则：前缀树一次遍历 vs 每条规则各自从根遍历"""
+    print("\n=== 共享前缀遍历性能 ===")
+    setup_logger("ERROR")
+    data = {"data": {"productList": [
+        {"id": i + 1, "name": f"商品{i}", "price": i % 100 + 0.5, "status": "active",
+         "purchasePlan": [{"id": j + 1, "amount": 100} for j in range(3)]}
+        for i in range(20000)
+    ]}}
+    plan = compile_rules(
+        "data.productList.*.id > 0",
+        "data.productList.*.name",
+        "data.productList.*.price > 0",
+        "data.productList.*.status == 'active'",
+        "data.productList.*.purchasePlan.*.id > 0",
+        "data.productList.*.purchasePlan.*.amount >= 100",
+    )
+
+    def legacy():
+        return all([_validate_field_path(data, rule) for rule in plan.rules])
+
+    def current():
+        return check(data, plan)
+
+    assert legacy() == current() == True
+    
+    # 用通配符展开次数断言（不受计时波动影响）：共享前缀只展开一次
+    expansions = [0]
+    original_expansion = checker_module._iter_expansion
+
+    def counting_expansion(*args):
+        expansions[0] += 1
+        return original_expansion(*args)
+
+    checker_module._iter_expansion = counting_expansion
+    try:
+        legacy()
+        legacy_expansions, expansions[0] = expansions[0], 0
+        current()
+        current_expansions = expansions[0]
+    finally:
+        checker_module._iter_expansion = original_expansion
+    print(f"共享前缀遍历: 通配符展开次数 优化前 {legacy_expansions}, 优化后 {current_expansions}")
+    # 6 条规则各展开一次商品列表，2 条规则各展开每个商品的 purchasePlan
+    assert (legacy_expansions, current_expansions) == (6 + 2 * 20000, 1 + 20000)
+    
+    # 计时只输出对比结果
+    legacy_time, current_time = _best_of(legacy, current, 3, repeat=3)
+    _report("共享前缀遍历", legacy_time, current_time)
+
+
+def test_debug_logging_benchmark():
+    """未开启调试日志：按级别跳过调试消息构建 vs 每个值都构建调试消息后交给日志函数丢弃"""
+    print("\n=== 非调试日志路径性能 ===")
+    setup_logger("INFO")
+    rows = [{"id": i + 1, "name": f"商品{i}", "price": i % 100 + 0.5} for i in range(100000)]
+    rules = compile_rules("id > 0", "name", "price > 0").rules
+
+    def legacy():
+        for row_index, row in enumerate(rows):
+            for rule in rules:
+                for value, path in rule.path.iter_values(row, (None, row_index)):
+                    result = rule.func(value)
+                    log_debug(f"校验字段 '{_format_path(path)}': {type(value).__name__} = {repr(value)} | "
+                              f"校验器: {rule.validator} | 期望值: {repr(rule.expect)} | 检验结果: {'✓' if result else '✗'}")
+        return True
+
+    def current():
+        return check_list(rows, "id > 0", "name", "price > 0")
+
+    assert legacy() == current() == True
+    legacy_time, current_time = _best_of(legacy, current, 1, repeat=3)
+    _report("非调试日志路径", legacy_time, current_time)
+    assert current_time <= legacy_time
+
+
+def test_no_debug_formatting():
+    """未开启调试日志时，校验通过的值不会被格式化"""
+    print("\n=== 调试消息延迟构建 ===")
+    setup_logger("INFO")
+
+    class Value:
+        reprs = 0
+
+        def __repr__(self):
+            Value.reprs += 1
+            return "Value()"
+
+    data = {"items": [Value() for _ in range(1000)], "single": Value()}
+    assert check(data, "items.*", "single", {"field": "items.*", "validator": "type_match", "expect": Value})
+    assert check_list([{"value": value} for value in data["items"]], "value")
+    assert Value.reprs == 0
+    print("调试消息延迟构建: ✓")
+
+
+def main():
+    test_rule_tokenize_benchmark()
+    test_wildcard_early_exit_benchmark()
+    test_plain_path_benchmark()
+    test_shared_prefix_benchmark()
+    test_debug_logging_benchmark()
+    test_no_debug_formatting()
+
+
+if __name__ == "__main__":
+    main()
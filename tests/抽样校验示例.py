@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+抽样校验示例 - 超大集合只校验随机抽取的部分元素
+
+- check_sampled(): 通配符展开的集合按固定个数或比例抽样
+- check_list_sampled(): 列表按下标抽样，迭代器使用蓄水池抽样或伯努利抽样
+- 结果包含抽样个数、观测失败率及其置信上限，相同种子结果可复现
+- 收集模式下同一规则的失败汇总为一条日志（失败次数、示例和值类型分布）
+"""
+
+import sys
+import os
+import logging
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from general_validator.logger import setup_logger
+from general_validator.checker import check_sampled, check_list_sampled, check_list_rows, Sampling, compile_rules, \
+    set_failure_examples
+
+
+def make_rows(count, bad_every=100):
+    """生成测试行，每 bad_every 行有一行 sku 为空"""
+    return [{"id": i, "sku": "" if i % bad_every == 0 else f"SKU-{i}"} for i in range(count)]
+
+
+def test_sampling_spec():
+    """测试抽样方式参数"""
+    print("\n=== 抽样方式测试 ===")
+    assert Sampling(size=10).count(1000) == 10
+    assert Sampling(size=10).count(3) == 3
+    assert Sampling(fraction=0.001).count(1500) == 2
+    assert Sampling(fraction=0.5).count(1) == 1
+
+    for kwargs in ({}, {"size": 1, "fraction": 0.1}, {"size": 0}, {"fraction": 1.5}, {"size": 5, "confidence": 1}):
+        try:
+            Sampling(**kwargs)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            print(f"非法抽样方式: {e}")
+
+    try:
+        Sampling(size=1).size = 2
+        assert False, "应该抛出异常"
+    except AttributeError:
+        pass
+    print("抽样方式: ✓")
+
+
+def test_check_sampled():
+    """测试通配符抽样校验"""
+    print("\n=== 通配符抽样校验测试 ===")
+    setup_logger("ERROR")
+    data = {"meta": {"count": 200000}, "rows": make_rows(200000)}
+    sampling = Sampling(size=2000, seed=42)
+
+    result = check_sampled(data, sampling, "rows.*.id >= 0")
+    assert result.passed and (result.total, result.sampled, result.failed) == (200000, 2000, 0)
+    assert result.failure_rate == 0.0 and 0 < result.upper_bound < 0.002
+
+    # 相同种子结果可复现
+    result = check_sampled(data, sampling, "rows.*.sku")
+    assert result == check_sampled(data, sampling, "rows.*.sku")
+    assert not result.passed and result.failed > 0
+    assert result.failure_rate <= result.upper_bound
+    # 观测失败率接近真实失败率 1%
+    assert 0.002 < result.failure_rate < 0.03
+
+    # 切片范围内抽样，不含通配符的规则完整校验
+    result = check_sampled(data, Sampling(fraction=0.1, seed=1), "rows[1:100].sku", "meta.count > 0")
+    assert result.passed and (result.total, result.sampled) == (100, 11)
+
+    # 全部元素都被抽中时，上限即为实际失败率
+    result = check_sampled({"rows": make_rows(10)}, Sampling(size=100), "rows.*.sku")
+    assert (result.sampled, result.failed, result.upper_bound) == (10, 1, 0.1)
+
+    # 预编译规则同样适用
+    assert check_sampled(data, sampling, compile_rules("rows.*.id >= 0")).passed
+    print("通配符抽样校验: ✓")
+
+
+def test_check_list_sampled():
+    """测试列表抽样校验"""
+    print("\n=== 列表抽样校验测试 ===")
+    setup_logger("ERROR")
+    rows = make_rows(100000)
+
+    result = check_list_sampled(rows, Sampling(size=1000, seed=7), "id >= 0", sku="!= 'never'")
+    assert result.passed and (result.total, result.sampled) == (100000, 1000)
+
+    # 迭代器：蓄水池抽样与伯努利抽样都只遍历一次
+    result = check_list_sampled(iter(rows), Sampling(size=1000, seed=7), "sku")
+    assert result == check_list_sampled(iter(rows), Sampling(size=1000, seed=7), "sku")
+    assert (result.total, result.sampled) == (100000, 1000) and result.failed > 0
+    result = check_list_sampled((row for row in rows), Sampling(fraction=0.01, seed=7), "sku")
+    assert result.total == 100000 and 700 < result.sampled < 1300
+
+    try:
+        check_list_sampled(12, Sampling(size=1), "id")
+        assert False, "应该抛出异常"
+    except TypeError as e:
+        print(f"非法数据: {e}")
+    print("列表抽样校验: ✓")
+
+
+def test_failure_summary():
+    """测试收集模式的失败汇总：每个规则只输出一条失败日志"""
+    print("\n=== 失败汇总测试 ===")
+    setup_logger("WARNING")
+    rows = [{"id": i, "sku": None if i % 4 == 0 else "", "qty": 1} for i in range(40000)]
+
+    warnings = []
+    original_log = logging.Logger.log
+
+    def capture_log(self, level, msg, *args, **kwargs):
+        if level == logging.WARNING:
+            warnings.append(msg % args if args else msg)
+
+    logging.Logger.log = capture_log
+    try:
+        result = check_list_rows(rows, "sku", "qty > 0")
+        assert len(result.failed_rows) == 40000
+        assert len(warnings) == 1, warnings
+        summary = warnings[0]
+        assert "共40000个值失败" in summary and "str: 30000, NoneType: 10000" in summary
+        assert "前5个示例: '[0].sku' = None, '[1].sku' = ''" in summary and "'[5].sku'" not in summary
+
+        # 同一行前面的规则失败时，后面的规则仍然校验并计入汇总
+        warnings.clear()
+        result = check_list_rows([{"p": 0, "n": ""}, {"p": -1, "n": ""}, {"p": 2, "n": ""}], "p > 0", "n")
+        assert result.failed_rows == (0, 1, 2)
+        assert any(w.startswith("校验失败汇总: p > 0 - 共2个值失败") for w in warnings), warnings
+        assert any(w.startswith("校验失败汇总: n - 共3个值失败") for w in warnings), warnings
+
+        warnings.clear()
+        set_failure_examples(2)
+        result = check_sampled({"rows": rows}, Sampling(size=1000, seed=3), "rows.*.sku", "rows.*.qty > 0")
+        assert result.failed == 1000
+        summaries = [w for w in warnings if w.startswith("校验失败汇总")]
+        assert len(summaries) == 1 and "前2个示例" in summaries[0] and "共1000个值失败" in summaries[0]
+
+        warnings.clear()
+        set_failure_examples(0)
+        check_list_sampled(rows, Sampling(size=100, seed=3), "sku")
+        assert len(warnings) == 2 and "示例" not in warnings[0]
+
+        try:
+            set_failure_examples(-1)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            print(f"非法示例个数: {e}")
+    finally:
+        logging.Logger.log = original_log
+        set_failure_examples(5)
+        setup_logger("ERROR")
+    print("失败汇总: ✓")
+
+
+def main():
+    test_sampling_spec()
+    test_check_sampled()
+    test_check_list_sampled()
+    test_failure_summary()
+    print("\n✅ 抽样校验测试完成")
+
+
+if __name__ == "__main__":
+    main()
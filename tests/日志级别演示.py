@@ -11,8 +11,16 @@ import os
 # 添加当前目录到系统路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from general_validator.logger import setup_logger
-from general_validator.checker import check
+from general_validator import logger
+import io
+import logging
+import threading
+import time
+
+from general_validator.logger import setup_logger, log_debug, log_info, is_enabled_for, set_silent, silent, \
+    log_warning, dropped_log_count, flush_logs
+from general_validator.checker import check, check_list, check_nested, check_when, checker, check_sampled, \
+    check_list_sampled, Sampling
 
 def demo_validation():
     """演示校验功能"""
@@ -43,6 +51,136 @@ def demo_validation():
     
     print(f"校验结果: {result}")
 
+def test_logger_cache():
+    """测试日志函数缓存 logger：只在 setup_logger 修改配置后重新解析，级别变更立即生效"""
+    calls = []
+    original = logger.get_logger
+
+    def counting_get_logger(name=None):
+        calls.append(name)
+        return original(name)
+
+    logger.get_logger = counting_get_logger
+    try:
+        setup_logger("WARNING")
+        for i in range(100):
+            log_info("不会输出的消息 %d", i)
+            log_debug("不会输出的消息 %d", i)
+        assert len(calls) == 1
+        assert not is_enabled_for("info")
+
+        setup_logger("DEBUG")
+        assert is_enabled_for("debug")
+        assert len(calls) == 2
+        assert len(logger.get_logger().handlers) == 1
+    finally:
+        logger.get_logger = original
+        setup_logger("INFO")
+    print("✓ 日志函数缓存 logger，配置变更后重新解析")
+
+
+def test_quiet_mode():
+    """测试静默模式：单次调用 quiet=True 与全局 set_silent()，不调用 logger，也不格式化消息"""
+    setup_logger("DEBUG")
+
+    class Value:
+        reprs = 0
+
+        def __repr__(self):
+            Value.reprs += 1
+            return "Value()"
+
+    records = []
+    original_log = logging.Logger.log
+
+    def counting_log(self, *args, **kwargs):
+        records.append(args)
+        return original_log(self, *args, **kwargs)
+
+    data = {"items": [{"id": 0, "v": Value()}], "status": "active"}
+    logging.Logger.log = counting_log
+    try:
+        assert check(data, "items.*.id > 0", "items.*.v", quiet=True) == False
+        assert check_list(data["items"], "v", id="> 0", quiet=True) == False
+        assert check_nested({"orders": [data]}, "orders", "items", "id > 0", quiet=True) == False
+        assert check_when(data, "status == 'active'", "items.*.id > 0", quiet=True) == False
+        assert checker(data).greater_than("items.*.id", 0).validate(quiet=True) == False
+        assert not check_sampled(data, Sampling(size=1), "items.*.id > 0", quiet=True).passed
+        assert not check_list_sampled(data["items"], Sampling(size=1), "v", id="> 0", quiet=True).passed
+        assert not records and Value.reprs == 0
+
+        set_silent(True)
+        try:
+            assert check(data, "items.*.id > 0") == False
+            assert not records and not is_enabled_for("error")
+        finally:
+            set_silent(False)
+
+        # 静默只对当前线程生效，退出后恢复日志输出
+        seen = []
+        with silent():
+            worker = threading.Thread(target=lambda: seen.append(is_enabled_for("debug")))
+            worker.start()
+            worker.join()
+            assert not is_enabled_for("debug")
+        assert seen == [True]
+        check(data, "items.*.v")
+        assert records and Value.reprs > 0
+    finally:
+        logging.Logger.log = original_log
+        setup_logger("INFO")
+    print("✓ 静默模式不调用 logger，也不格式化消息")
+
+
+def test_queue_logging():
+    """测试非阻塞日志：输出端很慢时日志调用立即返回，队列已满的日志被丢弃并计数"""
+
+    class SlowStream(io.StringIO):
+        def write(self, text):
+            time.sleep(0.002)
+            return super().write(text)
+
+    stdout = sys.stdout
+    sys.stdout = slow = SlowStream()
+    try:
+        setup_logger("INFO", queue_size=50)
+        start = time.perf_counter()
+        for i in range(1000):
+            log_warning("校验失败 %d", i)
+        elapsed = time.perf_counter() - start
+        flush_logs()
+    finally:
+        sys.stdout = stdout
+    written = slow.getvalue().count("校验失败")
+    dropped = dropped_log_count()
+    # 同步写出至少需要 2 秒
+    assert elapsed < 1, elapsed
+    assert dropped > 0 and written + dropped == 1000, (written, dropped)
+
+    # 队列 handler 只修改记录的副本，其他 handler 收到的原记录保留参数和异常信息
+    records = []
+    capture = logging.Handler()
+    capture.emit = records.append
+    queue_logger = logger.get_logger()
+    queue_logger.addHandler(capture)
+    try:
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            queue_logger.error("异常 %s", "x", exc_info=True)
+        flush_logs()
+        # 后台线程写入创建 handler 时的输出流
+        queued = slow.getvalue()
+    finally:
+        queue_logger.removeHandler(capture)
+    assert records[0].args == ("x",) and records[0].exc_info[0] is ValueError
+    assert "异常 x" in queued and "ValueError: bad" in queued
+
+    setup_logger("INFO", queue_size=0)
+    assert dropped_log_count() == 0
+    print(f"✓ 非阻塞日志: 1000 条耗时 {elapsed:.3f}s，写出 {written} 条，丢弃 {dropped} 条")
+
+
 def main():
     """主函数"""
     print("📋 日志级别控制演示")
@@ -68,6 +206,10 @@ def main():
     print("- INFO: 显示校验开始和完成的汇总信息（默认级别）")
     print("- WARNING: 只显示校验失败的警告信息")
     print("- ERROR: 只显示数据结构异常等严重错误")
+    
+    test_logger_cache()
+    test_quiet_mode()
+    test_queue_logging()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -6,6 +6,7 @@
 
 import sys
 import os
+import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from general_validator.checker import check_when, checker
@@ -141,6 +142,55 @@ def test_failed_cases():
     print(f"所有校验通过的结果: {result}")
 
 
+def test_element_scoped_when():
+    """测试按元素绑定的条件校验：条件和then规则作用于同一个元素"""
+    print("\n=== 测试按元素绑定的条件校验 ===")
+    
+    data = {
+        "products": [
+            {"status": "active", "price": 10},
+            {"status": "inactive", "price": 0},
+            {"status": "active", "price": 5}
+        ]
+    }
+    
+    # 非active的商品价格为0，不影响结果
+    assert check_when(data, "products.*.status == 'active'", "products.*.price > 0")
+    assert checker(data).when("products.*.status == 'active'", "products.*.price > 0").validate()
+    
+    # active的商品价格为0，校验失败
+    data["products"][2]["price"] = 0
+    assert not check_when(data, "products.*.status == 'active'", "products.*.price > 0")
+    assert not checker(data).when("products.*.status == 'active'", "products.*.price > 0").validate()
+    
+    # 多级通配符按最内层的公共元素绑定
+    orders = {"orders": [{"lines": [{"status": "open", "qty": 1}, {"status": "closed", "qty": 0}]}]}
+    assert check_when(orders, "orders.*.lines.*.status == 'open'", "orders.*.lines.*.qty > 0")
+    
+    # 不共享通配符前缀时条件作用于整个数据：并非所有商品都是active，跳过then校验
+    assert check_when(data, "products.*.status == 'active'", "total > 0")
+    
+    # 条件不满足不是校验失败，不输出警告；then规则的失败日志显示元素的完整路径
+    warnings = []
+    original_log = logging.Logger.log
+    
+    def capture_log(self, level, msg, *args, **kwargs):
+        if level == logging.WARNING:
+            warnings.append(msg % args if args else msg)
+    
+    logging.Logger.log = capture_log
+    try:
+        inactive = {"products": [{"status": "inactive", "price": 0} for _ in range(3)]}
+        assert check_when(inactive, "products.*.status == 'active'", "products.*.price > 0")
+        assert not warnings, warnings
+        assert not check_when(data, "products.*.status == 'active'", "products.*.price > 0")
+        assert any("'products[2].price'" in w for w in warnings), warnings
+        assert not any("'status'" in w or "'price'" in w for w in warnings), warnings
+    finally:
+        logging.Logger.log = original_log
+    print("按元素绑定的条件校验通过")
+
+
 if __name__ == "__main__":
     print("批量条件校验功能测试")
     print("=" * 50)
@@ -149,5 +199,6 @@ if __name__ == "__main__":
     test_batch_when()
     test_checker_batch_when()
     test_failed_cases()
+    test_element_scoped_when()
     
     print("\n测试完成！") 
\ No newline at end of file
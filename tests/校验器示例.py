@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+校验器示例 - 展示正则等校验器在规则解析阶段的预处理能力
+
+- 正则表达式在规则解析时预编译，非法正则在解析时报错
+- 正则支持 match（默认）、fullmatch、search 三种匹配方式
+- 类型名称在规则解析时解析为类型对象，不支持的类型名称在解析时报错
+- in_values / not_in_values 的集合在规则解析时转换为 frozenset，支持 in [..] / not in [..] 语法
+- between / length_between 编译为单条区间规则，一次遍历同时校验上下限，支持 in a..b / #in a..b 语法
+"""
+
+import re
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from general_validator.logger import setup_logger
+from general_validator.checker import check, checker, compile_rules
+
+
+def test_regex_modes():
+    """测试正则匹配方式"""
+    print("\n=== 正则匹配方式测试 ===")
+    setup_logger("WARNING")
+    data = {"codes": ["AB-001", "AB-002x"], "message": "order AB-001 created"}
+
+    # match：从开头匹配
+    assert check(data, "codes.* ~= 'AB-\\d+'") == True
+    assert check(data, {"field": "codes.*", "validator": "regex", "expect": r"AB-\d+"}) == True
+
+    # fullmatch：完整匹配
+    assert check(data, {"field": "codes.*", "validator": "regex_fullmatch", "expect": r"AB-\d+"}) == False
+    assert check(data, {"field": "codes.0", "validator": "regex_fullmatch", "expect": r"AB-\d+"}) == True
+
+    # search：任意位置匹配
+    assert check(data, {"field": "message", "validator": "regex", "expect": r"AB-\d+"}) == False
+    assert check(data, {"field": "message", "validator": "regex_search", "expect": r"AB-\d+"}) == True
+
+    # 支持已编译的正则对象
+    assert check(data, {"field": "message", "validator": "regex_search", "expect": re.compile(r"ab-\d+", re.I)}) == True
+
+    # 链式调用指定匹配方式
+    assert checker(data).matches_regex("codes.*", r"AB-\d+", mode="fullmatch").validate() == False
+    assert checker(data).matches_regex("message", r"created$", mode="search").validate() == True
+    print("正则匹配方式: ✓")
+
+
+def test_regex_compile_once():
+    """测试正则在解析时预编译"""
+    print("\n=== 正则预编译测试 ===")
+    plan = compile_rules("items.*.email ~= '^[a-z]+@example\\.com$'")
+    data = {"items": [{"email": f"user{'x' * (i % 5)}@example.com"} for i in range(1000)]}
+    setup_logger("WARNING")
+    assert check(data, plan) == True
+
+    # 非法正则在解析时报错
+    try:
+        compile_rules("email ~= '[abc'")
+        assert False, "应该抛出异常"
+    except ValueError as e:
+        print(f"非法正则: {e}")
+
+    try:
+        checker(data).matches_regex("items.*.email", "x", mode="prefix")
+        assert False, "应该抛出异常"
+    except ValueError as e:
+        print(f"非法匹配方式: {e}")
+
+
+def test_type_resolution():
+    """测试类型校验的解析与bool/int语义"""
+    print("\n=== 类型解析测试 ===")
+    setup_logger("WARNING")
+    data = {"count": 3, "ratio": 0.5, "flag": True, "name": "abc", "nothing": None}
+
+    assert check(data, "count @= 'int'", "count @= 'integer'", "ratio @= 'float'", "flag @= 'bool'", "nothing @= 'null'") == True
+    assert check(data, "count @= 'number'", "ratio @= 'number'") == True
+
+    # 布尔值不视为整数或数字
+    assert check(data, "flag @= 'int'") == False
+    assert check(data, "flag @= 'number'") == False
+    assert checker(data).is_integer("flag").validate() == False
+    assert checker(data).is_number("flag").validate() == False
+
+    # 显式包含bool的类型元组
+    assert checker(data).is_type("flag", (int, bool)).is_type("count", int).validate() == True
+    assert checker(data).is_type("name", (int, float)).validate() == False
+
+    # 不支持的类型名称在解析时报错，且不会执行任意表达式
+    for rule in ("count @= 'integerx'", "count @= \"__import__('os')\""):
+        try:
+            compile_rules(rule)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            print(f"类型名称不支持: {e}")
+    print("类型解析: ✓")
+
+
+def test_membership():
+    """测试集合成员校验"""
+    print("\n=== 集合成员校验测试 ===")
+    setup_logger("WARNING")
+    allowed = [f"SKU-{i}" for i in range(5000)]
+    data = {
+        "lines": [{"sku": f"SKU-{i % 5000}", "qty": i % 3} for i in range(20000)],
+        "status": "active",
+        "tags": [["a"], ["b"]]
+    }
+
+    # 链式调用与字典格式：可哈希集合转换为 frozenset
+    assert checker(data).in_values("lines.*.sku", allowed).validate() == True
+    assert checker(data).not_in_values("lines.*.sku", ["SKU-X"]).validate() == True
+    assert check(data, {"field": "lines.*.qty", "validator": "in_values", "expect": (0, 1)}) == False
+    plan = compile_rules({"field": "lines.*.sku", "validator": "in_values", "expect": allowed})
+    assert isinstance(plan.rules[0].expect, list)  # 日志中保留原始期望值
+
+    # 字符串语法
+    assert check(data, "status in ['active', 'pending']", "status not in ['deleted']") == True
+    assert check(data, "lines.*.qty in [0, 1, 2]", "lines.*.qty not in [3, 4]") == True
+    assert check(data, "status in ['a>=b', deleted]") == False
+    assert compile_rules("code not in [1, -2, 'x', true]").rules[0].expect == [1, -2, 'x', True]
+
+    # 不可哈希的值回退到线性查找
+    assert check(data, {"field": "tags.*", "validator": "in_values", "expect": [["a"], ["b"]]}) == True
+    assert check(data, {"field": "tags.*", "validator": "in_values", "expect": [["a"]]}) == False
+
+    try:
+        compile_rules("status in 'active'")
+        assert False, "应该抛出异常"
+    except ValueError as e:
+        print(f"非法列表: {e}")
+
+    # 错误信息使用规则中的关键字
+    for rule, keyword in (("status in ['a'", "in 的期望值"), ("status not in 'a'", "not in 的期望值")):
+        try:
+            compile_rules(rule)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            assert str(e).startswith(keyword), e
+    print("集合成员校验: ✓")
+
+
+def test_range():
+    """测试区间校验"""
+    print("\n=== 区间校验测试 ===")
+    setup_logger("WARNING")
+    data = {"items": [{"price": i % 101, "name": "x" * (i % 20 + 1)} for i in range(1000)], "ratio": -0.5}
+
+    # 链式调用：每个区间只生成一条规则
+    dc = checker(data).between("items.*.price", 0, 100).length_between("items.*.name", 1, 20)
+    assert len(dc.rules) == 2
+    assert dc.validate() == True
+    assert checker(data).between("items.*.price", 0, 100, inclusive=False).validate() == False
+    assert checker(data).length_between("items.*.name", 1, 20, inclusive=False).validate() == False
+    assert checker(data).between("items.*.price", 1, 100).validate() == False
+
+    # 字符串语法
+    assert check(data, "items.*.price in 0..100", "items.*.name #in 1..20", "ratio in -1..0.5") == True
+    assert check(data, "items.*.price in 0..99") == False
+    assert check(data, "items.*.name #in 2..20") == False
+    rule = compile_rules("items.*.price in 0..100").rules[0]
+    assert (rule.validator, rule.expect) == ("range", (0, 100))
+    assert compile_rules("ratio in -1.5..2e3").rules[0].expect == (-1.5, 2000.0)
+
+    # 字典格式与旧版 length_between 校验器
+    assert check(data, {"field": "items.*.price", "validator": "range", "expect": (0, 100)}) == True
+    assert check(data, {"field": "items.*.name", "validator": "length_between", "expect": [1, 20]}) == True
+
+    for rule in ("price in 0..", "price in 10..1", {"field": "price", "validator": "range", "expect": 5}):
+        try:
+            compile_rules(rule)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            print(f"非法区间: {e}")
+    print("区间校验: ✓")
+
+
+def test_quantifiers():
+    """测试量词通配符"""
+    print("\n=== 量词通配符测试 ===")
+    setup_logger("WARNING")
+    data = {
+        "payments": [{"is_default": False}, {"is_default": True}, {"is_default": False}],
+        "lines": [{"qty": 1}, {"qty": 2}],
+        "images": ["a.png", "b.png", ""],
+        "orders": [{"lines": [{"qty": 0}, {"qty": 1}]}, {"lines": [{"qty": 3}]}]
+    }
+
+    assert check(data, "payments.*any.is_default == true") == True
+    assert check(data, "payments.*1.is_default == true") == True
+    assert check(data, "payments.*2.is_default == false") == True
+    assert check(data, "payments.*2+.is_default == true") == False
+    assert check(data, "lines.*none.qty == 0") == True
+    assert check(data, "images.*2+") == True
+    assert check(data, "images.*3+") == False
+    assert check(data, "images.*3") == False
+    # 量词之前可以有普通通配符，之后的路径也可以再含通配符或量词
+    assert check(data, "orders.*.lines.*any.qty > 0") == True
+    assert check(data, "orders.*.lines.*none.qty == 0") == False
+    assert check(data, "orders.*any.lines.*.qty > 0") == True
+    assert check(data, "orders.*1.lines.*any.qty == 0") == True
+    assert check({"items": []}, "items.*any") == False
+    assert check({"items": []}, "items.*none") == True
+
+    # 链式调用
+    assert checker(data).any_match("payments", "is_default == true").none_match("lines", "qty == 0")\
+        .at_least(2, "images").exactly(1, "payments", "is_default == true").validate() == True
+    assert checker(data).at_least(3, "images").validate() == False
+
+    # 元素规则省略路径时作用于元素本身
+    dc = checker({"items": [0, 1, 2]}).any_match("items", "== 1").at_least(2, "items", "> 0")
+    assert dc.rules[0].field_path == "items.*any"
+    assert dc.validate() == True
+    assert checker({"items": [0, 2]}).any_match("items", "== 1").validate() == False
+
+    # 结果确定后立即停止
+    class Row(dict):
+        reads = 0
+
+        def __getitem__(self, key):
+            Row.reads += 1
+            return dict.__getitem__(self, key)
+
+    rows = {"rows": [Row(flag=True) for _ in range(1000)]}
+    assert check(rows, "rows.*any.flag == true") == True
+    assert Row.reads == 1
+    Row.reads = 0
+    assert check(rows, "rows.*3+.flag == true") == True
+    assert Row.reads == 3
+    Row.reads = 0
+    assert check(rows, "rows.*1.flag == true") == False
+    assert Row.reads == 2
+
+    try:
+        check({"value": 1}, "value.*any")
+        assert False, "应该抛出异常"
+    except Exception as e:
+        print(f"非法量词目标: {e}")
+    print("量词通配符: ✓")
+
+
+def main():
+    test_regex_modes()
+    test_regex_compile_once()
+    test_type_resolution()
+    test_membership()
+    test_range()
+    test_quantifiers()
+    print("\n✅ 校验器测试完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+规则解析示例 - 展示字符串规则的解析能力
+
+- 单次扫描定位操作符：期望值中包含操作符字符不影响解析
+- 期望值类型推断：整数、浮点数、负数、科学计数法、带引号字符串、布尔值、null
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from general_validator.logger import setup_logger
+from general_validator.checker import check, compile_rules, get_nested_value
+
+
+def parse(rule):
+    """返回规则解析结果 (字段路径, 校验器, 期望值)"""
+    compiled = compile_rules(rule).rules[0]
+    return compiled.field_path, compiled.validator, compiled.expect
+
+
+def test_operator_tokenize():
+    """测试操作符定位"""
+    print("\n=== 操作符定位测试 ===")
+    cases = [
+        ("data.id > 0", ("data.id", "gt", 0)),
+        ("data.name", ("data.name", "not_empty", True)),
+        ("items.*.id >= 1", ("items.*.id", "ge", 1)),
+        ("items.* *= 'x'", ("items.*", "contains", "x")),
+        ("tags #<= 5", ("tags", "length_le", 5)),
+        ("code > 'a==b'", ("code", "gt", "a==b")),
+        ("expr == \"x >= y\"", ("expr", "eq", "x >= y")),
+        ("name != 'a#=b'", ("name", "ne", "a#=b")),
+    ]
+    for rule, expected in cases:
+        result = parse(rule)
+        print(f"{rule!r:30} -> {result}")
+        assert result == expected, rule
+
+
+def test_literal_types():
+    """测试期望值类型推断"""
+    print("\n=== 期望值类型推断测试 ===")
+    cases = [
+        ("v == 200", 200, int),
+        ("v == -5", -5, int),
+        ("v == +7", 7, int),
+        ("v == 10.5", 10.5, float),
+        ("v == -0.25", -0.25, float),
+        ("v == 1e3", 1000.0, float),
+        ("v == 2.5E-2", 0.025, float),
+        ("v == '123'", "123", str),
+        ("v == true", True, bool),
+        ("v == False", False, bool),
+        ("v == null", None, type(None)),
+        ("v == active", "active", str),
+        ("v == 1.2.3", "1.2.3", str),
+    ]
+    for rule, value, value_type in cases:
+        expect = parse(rule)[2]
+        print(f"{rule!r:20} -> {expect!r} ({type(expect).__name__})")
+        assert expect == value and type(expect) is value_type, rule
+
+
+def test_literal_validation():
+    """测试负数和科学计数法在校验中的使用"""
+    print("\n=== 数值字面量校验测试 ===")
+    setup_logger("WARNING")
+    data = {"temperature": -3, "ratio": 0.002, "label": "a>=b"}
+    assert check(data, "temperature > -5", "temperature < 0", "ratio < 1e-2", "label == 'a>=b'") == True
+    assert check(data, "temperature >= -2") == False
+
+
+def test_path_segments():
+    """测试负数索引、切片和步长路径段"""
+    print("\n=== 路径段测试 ===")
+    setup_logger("WARNING")
+    data = {"items": [{"id": i} for i in range(1000)]}
+
+    assert get_nested_value(data, "items.-1.id") == 999
+    assert get_nested_value(data, "items[-1].id") == 999
+    assert get_nested_value(data, "items[0].id") == 0
+    assert check(data, "items.-1.id == 999", "items[-1000].id == 0") == True
+    assert check(data, "items[0:100].id < 100", "items.0:100.id < 100") == True
+    assert check(data, "items[0:101].id < 100") == False
+    assert check(data, "items[-5:].id >= 995") == True
+    assert check(data, "items[::100].id > 0") == False
+    assert check(data, "items[::100].id in [0, 100, 200, 300, 400, 500, 600, 700, 800, 900]") == True
+    assert check(data, "items[1::2].id != 0", "items[990:].id > 900", "items[*].id >= 0") == True
+
+    # 切片按下标逐个取值，不复制整个列表
+    class Items(list):
+        reads = 0
+
+        def __getitem__(self, index):
+            Items.reads += 1
+            return list.__getitem__(self, index)
+
+    items = {"items": Items({"id": i} for i in range(100000))}
+    assert check(items, "items[::1000].id >= 0") == True
+    assert Items.reads == 100
+
+    for rule, error in (("items.-1001.id", "索引超出范围"), ("items[::0].id", "步长"), ("items.0:1.id.0:1", "只能用于列表")):
+        try:
+            check(data, rule)
+            assert False, "应该抛出异常"
+        except Exception as e:
+            assert error in str(e), str(e)
+
+    # 字典上切片和负数形式的段按普通键取值
+    schedule = {"sched": {"10:30": "x", "-1": "y"}}
+    assert check(schedule, "sched.10:30", "sched.10:30 == 'x'", "sched.-1 == 'y'")
+    assert check({"days": [schedule["sched"]]}, "days.*.10:30 == 'x'")
+    print("路径段: ✓")
+
+
+def main():
+    test_operator_tokenize()
+    test_literal_types()
+    test_literal_validation()
+    test_path_segments()
+    print("\n✅ 规则解析测试完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from general_validator.logger import setup_logger
-from general_validator.checker import checker
+from general_validator.checker import checker, compile_rules
 
 def test_basic_validations():
     """测试基础校验功能"""
@@ -230,6 +230,52 @@ def test_conditional_validations():
     assert result == True
 
 
+def test_structured_rules():
+    """测试链式调用直接构建预编译规则（不再经过规则字符串）"""
+    print("\n=== 结构化规则测试 ===")
+    
+    from decimal import Decimal
+    data = {
+        "ratio": 0.1 + 0.2,
+        "amount": Decimal("9.99"),
+        "a>b": "x",
+        "name": "It's ok",
+        "code": "1"
+    }
+    
+    dc = checker(data)\
+        .equals("ratio", 0.1 + 0.2)\
+        .equals("amount", Decimal("9.99"))\
+        .not_empty("a>b")\
+        .equals("name", "It's ok")\
+        .field("code", "==", "'1'")\
+        .field("ratio", "gt", 0.3)
+    assert dc.validate() == True
+    
+    # 规则对象可直接复用，描述在需要时才生成
+    assert str(dc.rules[0]) == "ratio == 0.30000000000000004"
+    assert str(dc.rules[2]) == "a>b"
+    assert checker(data).validate(compile_rules(*dc.rules)) == True
+    
+    # 字符串 '1' 与整数 1 不再因格式化而混淆
+    assert checker(data).equals("code", 1).validate() == False
+    
+    # field() 的字符串期望值按规则字面量解析，与 "路径 操作符 期望值" 表达式相同
+    assert checker({"x": 5}).field("x", ">", "3").validate() == True
+    assert checker({"s": "ab"}).field("s", "==", "'ab'").validate() == True
+    assert checker({"b": True, "n": None}).field("b", "==", "true").field("n", "==", "null").validate() == True
+    assert checker({"s": "b"}).field("s", "in", "['a', 'b']").field("s", "not in", ["c"]).validate() == True
+    assert checker({"x": 5}).field("x", "gt", "3").field("x", "gt", 4.5).validate() == True
+    
+    # 规则错误在 validate() 时以数据结构异常抛出
+    dc = checker({"s": "a"}).matches_regex("s", "(")
+    try:
+        dc.validate()
+        assert False, "应该抛出异常"
+    except Exception as e:
+        assert "数据结构异常" in str(e)
+
+
 def test_failure_cases():
     """测试失败场景"""
     print("\n=== 失败场景测试 ===")
@@ -272,6 +318,7 @@ def main():
         test_length_validations,
         test_batch_validations,
         test_conditional_validations,
+        test_structured_rules,
         test_failure_cases
     ]
     
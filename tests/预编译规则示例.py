@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+预编译规则示例 - 一次解析，多次校验
+
+compile_rules() 将校验规则预先解析为不可变的规则集合（RulePlan），
+可直接传给 check()、check_list()、check_when() 以及 DataChecker.validate()，
+在大量数据上重复校验时不再重复解析规则字符串。
+链式调用也可以不绑定数据，通过 checker()...freeze() 得到同样的规则集合。
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from general_validator.logger import setup_logger
+from general_validator.checker import (
+    check, check_list, check_when, checker, compile_rules, RulePlan,
+    rule_cache_info, clear_rule_cache, set_rule_cache_size
+)
+
+
+def build_response(product_id, price):
+    return {
+        "status_code": 200,
+        "data": {
+            "product": {"id": product_id, "name": f"商品{product_id}", "price": price},
+            "productList": [
+                {"id": 1, "name": "商品A", "price": 10.5, "status": "active"},
+                {"id": 2, "name": "商品B", "price": 20.0, "status": "active"}
+            ]
+        }
+    }
+
+
+def test_compile_rules_basic():
+    """测试预编译规则在多份数据上复用"""
+    print("\n=== 预编译规则复用测试 ===")
+    setup_logger("WARNING")
+
+    plan = compile_rules(
+        "status_code == 200",
+        "data.product.id > 0",
+        "data.product.name",
+        {"field": "data.product.price", "validator": "ge", "expect": 0},
+        "data.productList.*.id > 0"
+    )
+    assert isinstance(plan, RulePlan)
+    assert len(plan) == 5
+
+    for i in range(1, 6):
+        assert check(build_response(i, i * 1.5), plan) == True
+    assert check(build_response(0, 1.0), plan) == False
+
+    # 预编译规则与普通规则混合使用
+    assert check(build_response(1, 1.0), plan, "data.productList.*.status == 'active'") == True
+
+    # 空规则集合视为全部通过
+    empty = compile_rules()
+    assert len(empty) == 0
+    assert check(build_response(1, 1.0), empty) == True
+    assert empty.validate(build_response(0, 1.0)) == True
+    print("预编译规则复用: ✓")
+
+
+def test_compile_rules_immutable():
+    """测试预编译规则不可修改"""
+    print("\n=== 预编译规则不可变测试 ===")
+    plan = compile_rules("data.product.id > 0")
+    rule = plan.rules[0]
+
+    assert [name for name, _ in rule.path.segments] == ["data", "product", "id"]
+    assert not rule.path.has_wildcard
+    assert rule.expect == 0
+
+    for target, name in ((plan, "rules"), (rule, "expect"), (rule.path, "segments")):
+        try:
+            setattr(target, name, None)
+            assert False, "应该抛出异常"
+        except AttributeError as e:
+            print(f"修改被拒绝: {e}")
+
+
+def test_compile_rules_invalid():
+    """测试非法规则在编译时报错"""
+    print("\n=== 非法规则测试 ===")
+    for invalid_rule in (123, {"validator": "eq", "expect": 1}, {"field": "a", "validator": "unknown"},
+                         {"field": "a", "validator": "length_between", "expect": 5}):
+        try:
+            compile_rules(invalid_rule)
+            assert False, "应该抛出异常"
+        except ValueError as e:
+            print(f"编译失败: {e}")
+
+
+def test_plan_with_helpers():
+    """测试专用函数和链式调用接受预编译规则"""
+    print("\n=== 专用函数接受预编译规则测试 ===")
+    setup_logger("WARNING")
+    data = build_response(1, 9.9)
+
+    # check_list: 规则路径相对于列表元素
+    row_plan = compile_rules("id > 0", "name", "price >= 10")
+    assert check_list(data["data"]["productList"], row_plan) == True
+    assert check_list(data["data"]["productList"], row_plan, "price > 15") == False
+
+    # check_when: 条件与then均可为预编译规则
+    condition = compile_rules("data.product.id == 1")
+    assert check_when(data, condition, compile_rules("data.product.price < 10")) == True
+    assert check_when(data, condition, compile_rules("data.product.price > 10")) == False
+    assert check_when(data, "data.product.id == 2", compile_rules("data.product.price > 10")) == True
+
+    # DataChecker.validate: 链式规则与预编译规则一并校验
+    assert checker(data).not_empty("data.product.name").validate(compile_rules("status_code == 200")) == True
+    assert checker(data).validate(compile_rules("status_code == 404")) == False
+    print("专用函数接受预编译规则: ✓")
+
+
+def test_frozen_checker():
+    """测试不绑定数据的链式规则冻结为可复用的规则集合"""
+    print("\n=== 链式规则冻结测试 ===")
+    setup_logger("WARNING")
+    import threading
+
+    schema = checker()\
+        .not_empty("data.product.name")\
+        .greater_than("data.product.id", 0)\
+        .field("status_code", "== 200")\
+        .between("data.productList.*.price", 0, 100)\
+        .when("data.product.id == 1", "data.product.price < 10")\
+        .freeze()
+    assert isinstance(schema, RulePlan) and len(schema) == 5
+
+    assert schema.validate(build_response(1, 9.9)) == True
+    assert schema.validate(build_response(1, 19.9)) == False
+    assert schema.validate(build_response(0, 1.0)) == False
+    assert check(build_response(2, 50.0), schema) == True
+
+    # 多线程共享同一个规则集合
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(schema.validate(build_response(i + 2, 1.0)))) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [True] * 8
+
+    # 未绑定数据时不能直接校验；None 仍是合法数据
+    try:
+        checker().not_empty("data").validate()
+        assert False, "应该抛出异常"
+    except ValueError as e:
+        print(f"未绑定数据: {e}")
+    assert checker(None).is_none("").validate() == True
+    print("链式规则冻结: ✓")
+
+
+def test_shared_prefix():
+    """测试共享前缀的规则在一次遍历中校验"""
+    print("\n=== 共享前缀遍历测试 ===")
+    setup_logger("WARNING")
+    data = build_response(1, 9.9)
+    data["data"]["productList"].append({"id": 3, "name": "", "price": 30.0, "status": "inactive"})
+
+    plan = compile_rules(
+        "status_code == 200",
+        "data.productList.*.id > 0",
+        "data.productList.*.name",
+        "data.productList.*.price > 0",
+        "data.productList.*.status == 'active'",
+    )
+    assert plan.trie is plan.trie  # 前缀树随规则集合缓存
+    assert plan.trie.run(data) == [True, True, False, True, False]
+    assert check(data, plan) == False
+    assert check(data, *plan.rules[:2], plan.rules[3]) == True
+
+    # 失败的规则不影响同一前缀下其他规则继续校验
+    data["data"]["productList"][0]["price"] = -1
+    assert plan.trie.run(data) == [True, True, False, False, False]
+
+    # 数据结构异常归属到对应的规则
+    del data["data"]["productList"][1]["price"]
+    data["data"]["productList"][0]["price"] = 10.5
+    try:
+        check(data, plan)
+        assert False, "应该抛出异常"
+    except Exception as e:
+        assert "data.productList.*.price > 0" in str(e)
+        print(f"数据结构异常: {e}")
+
+    # 已失败的规则不再继续展开，后续缺失字段不会报错
+    assert check(data, "status_code == 200", "data.productList.*.price > 100") == False
+    print("共享前缀遍历: ✓")
+
+
+def test_rule_cache():
+    """测试规则解析缓存的命中统计和淘汰"""
+    print("\n=== 规则解析缓存测试 ===")
+    setup_logger("WARNING")
+    clear_rule_cache()
+    data = build_response(1, 9.9)
+
+    for _ in range(10):
+        check(data, "data.product.id > 0", {"field": "data.product.price", "validator": "gt", "expect": 0})
+    info = rule_cache_info()
+    print(f"缓存统计: {info}")
+    assert info.misses == 2 and info.hits == 18 and info.currsize == 2
+
+    # 相等但类型不同的期望值不会互相命中
+    true_rule = compile_rules({"field": "flag", "validator": "eq", "expect": True}).rules[0]
+    one_rule = compile_rules({"field": "flag", "validator": "eq", "expect": 1}).rules[0]
+    assert true_rule.expect is True and one_rule.expect == 1 and one_rule.expect is not True
+
+    # 超出容量时淘汰最久未使用的规则
+    try:
+        set_rule_cache_size(2)
+        clear_rule_cache()
+        compile_rules("a > 1", "b > 1", "a > 1", "c > 1")
+        assert rule_cache_info().currsize == 2
+        compile_rules("b > 1")
+        assert rule_cache_info().misses == 4
+
+        # 关闭缓存
+        set_rule_cache_size(0)
+        compile_rules("a > 1", "a > 1")
+        assert rule_cache_info().currsize == 0
+    finally:
+        set_rule_cache_size(1024)
+        clear_rule_cache()
+    print("规则解析缓存: ✓")
+
+
+def main():
+    tests = [
+        test_compile_rules_basic,
+        test_compile_rules_immutable,
+        test_compile_rules_invalid,
+        test_plan_with_helpers,
+        test_frozen_checker,
+        test_shared_prefix,
+        test_rule_cache,
+    ]
+    passed = 0
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test_func.__name__} 失败: {e}")
+
+    print("\n" + "=" * 50)
+    print(f"测试结果: {passed}/{len(tests)} 通过")
+
+
+if __name__ == "__main__":
+    main()